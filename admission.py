@@ -0,0 +1,110 @@
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, Dict
+
+
+class LaneFull(Exception):
+    def __init__(self, lane: str, retry_after: int):
+        super().__init__(f"The {lane} queue is full")
+        self.lane = lane
+        self.retry_after = retry_after
+
+
+class AdmissionLane:
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, alpha: float = 0.2):
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_queue = max(0, max_queue)
+        self.alpha = alpha
+        self.active = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.completed = 0
+        self.avg_service_ms = 0.0
+        self._waiters = deque()
+
+    async def acquire(self):
+        if self.active < self.max_concurrency and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise LaneFull(self.name, self.retry_after())
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future in self._waiters:
+                self._waiters.remove(future)
+            elif future.done() and not future.cancelled():
+                self.release()
+            raise
+        self.admitted += 1
+
+    def release(self):
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    def record(self, elapsed_ms: float):
+        self.completed += 1
+        if self.completed == 1:
+            self.avg_service_ms = elapsed_ms
+        else:
+            self.avg_service_ms += self.alpha * (elapsed_ms - self.avg_service_ms)
+
+    def retry_after(self) -> int:
+        backlog_ms = (len(self._waiters) + 1) * self.avg_service_ms / self.max_concurrency
+        return max(1, math.ceil(backlog_ms / 1000.0))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "queued": len(self._waiters),
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "avg_service_ms": round(self.avg_service_ms, 3)
+        }
+
+
+class AdmissionController:
+    def __init__(self):
+        self.lanes = {
+            "interactive": AdmissionLane(
+                "interactive",
+                int(os.getenv("ADMISSION_INTERACTIVE_CONCURRENCY", 16)),
+                int(os.getenv("ADMISSION_INTERACTIVE_QUEUE", 256))
+            ),
+            "bulk": AdmissionLane(
+                "bulk",
+                int(os.getenv("ADMISSION_BULK_CONCURRENCY", 2)),
+                int(os.getenv("ADMISSION_BULK_QUEUE", 16))
+            )
+        }
+
+    @asynccontextmanager
+    async def slot(self, lane_name: str):
+        lane = self.lanes[lane_name]
+        await lane.acquire()
+        started = time.perf_counter()
+        try:
+            yield lane
+        finally:
+            lane.record((time.perf_counter() - started) * 1000.0)
+            lane.release()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: lane.stats() for name, lane in self.lanes.items()}
@@ -1,12 +1,20 @@
 import re
+import os
 import json
+import hashlib
+import threading
+import time
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from collections import Counter
 import nltk
 from textblob import TextBlob
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from language_packs import LanguagePackRegistry, compile_lexicon
+from model_registry import ModelRegistry, shared_models
+from profiling import current_profile
+from profiles import ALL_STAGES, COMPONENTS, DetectionProfile
 
 try:
     from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
@@ -16,8 +24,115 @@ except ImportError:
     TRANSFORMERS_AVAILABLE = False
     print("Warning: Transformers not available. Using fallback NLP methods.")
 
+class StageCostTracker:
+    def __init__(self, alpha: float = 0.2, decay: Optional[float] = None):
+        self.alpha = alpha
+        self.decay = decay if decay is not None else float(os.getenv("STAGE_COST_DECAY", 0.05))
+        self._costs: Dict[str, float] = {}
+        self._warmed = set()
+        self._decayed = set()
+        self._lock = threading.Lock()
+    
+    def record(self, stage: str, elapsed_ms: float):
+        with self._lock:
+            if stage not in self._warmed:
+                self._warmed.add(stage)
+                return
+            previous = self._costs.get(stage)
+            if previous is None or stage in self._decayed:
+                self._costs[stage] = elapsed_ms
+                self._decayed.discard(stage)
+            else:
+                self._costs[stage] = previous + self.alpha * (elapsed_ms - previous)
+    
+    def skipped(self, stage: str):
+        with self._lock:
+            if stage in self._costs:
+                self._costs[stage] *= 1.0 - self.decay
+                self._decayed.add(stage)
+    
+    def estimate(self, stage: str) -> float:
+        return self._costs.get(stage, 0.0)
+    
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {stage: round(cost, 3) for stage, cost in self._costs.items()}
+
+class BatchAnalysis:
+    def __init__(
+        self,
+        detector,
+        texts: List[str],
+        columns: List[str],
+        features: np.ndarray,
+        final_scores: np.ndarray,
+        is_toxic: np.ndarray,
+        severity: np.ndarray,
+        language: str,
+        profile: Optional[DetectionProfile] = None,
+        details: Optional[List[Dict[str, Any]]] = None,
+        skipped_stages: Optional[List[str]] = None
+    ):
+        self.detector = detector
+        self.texts = texts
+        self.columns = columns
+        self.features = features
+        self.final_scores = final_scores
+        self.is_toxic = is_toxic
+        self.severity = severity
+        self.language = language
+        self.profile = profile
+        self.details = details
+        self.skipped_stages = skipped_stages or []
+    
+    def __len__(self) -> int:
+        return len(self.texts)
+    
+    def column(self, name: str) -> np.ndarray:
+        return self.features[:, self.columns.index(name)]
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        if self.details is None:
+            raise ValueError("Per-item results need analyze_many(..., keep_details=True)")
+        results = []
+        for i, detail in enumerate(self.details):
+            row = self.features[i]
+            results.append({
+                "toxicity_score": float(round(row[0], 3)),
+                "context_score": float(round(row[1], 3)),
+                "sentiment_score": float(round(row[2], 3)),
+                "ai_toxicity_score": float(round(row[3], 3)),
+                "semantic_similarity_score": float(round(row[4], 3)),
+                "bypass_score": float(round(row[5], 3)),
+                "final_score": float(round(float(self.final_scores[i]), 3)),
+                "detected_patterns": detail["detected_patterns"],
+                "detected_words": detail["detected_words"],
+                "is_toxic": bool(self.is_toxic[i]),
+                "severity": str(self.severity[i]),
+                "degraded": bool(self.skipped_stages),
+                "skipped_stages": list(self.skipped_stages),
+                "language": self.language,
+                "profile": self.profile.name if self.profile is not None else "full"
+            })
+        return results
+
 class AIDetector:
-    def __init__(self):
+    STAGES = ALL_STAGES
+    STAGE_MODELS = {"ai": "toxicity"}
+    
+    def __init__(
+        self,
+        snapshot_path: Optional[str] = None,
+        language_packs: Optional[LanguagePackRegistry] = None,
+        models: Optional[ModelRegistry] = None,
+        fast_model_path: Optional[str] = None
+    ):
+        self.stage_costs = StageCostTracker()
+        self.models = models or shared_models
+        self.language = "en"
+        self.skip_stages = []
+        self.language_packs = language_packs or LanguagePackRegistry()
+        
         self.toxic_patterns = {
             "hate_speech": [
                 r"\b(i\s+hate\s+you\b)",
@@ -95,6 +210,13 @@ class AIDetector:
             "intensifiers": ["very", "really", "extremely", "totally", "completely", "absolutely"]
         }
         
+        self.context_weights = {
+            "negative_emotions": 0.3,
+            "threatening": 0.5,
+            "discriminatory": 0.7,
+            "intensifiers": 0.2
+        }
+        
         self.sentiment_words = {
             "positive": {"love", "like", "good", "great", "awesome", "amazing", "wonderful", "beautiful", "nice", "kind", "sweet", "gentle", "caring", "helpful"},
             "negative": {"hate", "dislike", "bad", "terrible", "awful", "horrible", "ugly", "mean", "cruel", "rude", "aggressive", "violent"}
@@ -106,6 +228,8 @@ class AIDetector:
             "negations": ["don't", "do not", "doesn't", "does not", "didn't", "did not", "won't", "will not", "can't", "cannot", "not", "never", "no"]
         }
         
+        self.safe_context_words = ["hate", "dislike", "bad", "terrible", "awful"]
+        
         self.toxic_phrases = [
             "i don't like you", "i dislike you", "i can't stand you", "you annoy me",
             "you bother me", "you irritate me", "you frustrate me", "you anger me",
@@ -153,86 +277,370 @@ class AIDetector:
             r"\b(you\s+piece\s*of\s*filth\b)"
         ]
         
+        self.model_names = {
+            "toxicity": "unitary/toxic-bert",
+            "sentiment": "cardiffnlp/twitter-roberta-base-sentiment-latest"
+        }
+        
+        from snapshot import content_hash
+        self.lexicon_hash = content_hash(self)
+        self.version = self.lexicon_hash
+        
+        self.snapshot_info = None
+        if snapshot_path:
+            from snapshot import load_snapshot
+            self.snapshot_info = load_snapshot(self, snapshot_path)
+        if self.snapshot_info is None:
+            self._build_matchers()
+        
+        self.fast_model = None
+        fast_model_path = fast_model_path if fast_model_path is not None else os.getenv("FAST_MODEL_PATH")
+        if fast_model_path:
+            self.load_fast_model(fast_model_path)
+        
         self.initialize_ai_models()
+    
+    def load_fast_model(self, path: str):
+        from distill import FastToxicityModel
+        from snapshot import file_hash
+        try:
+            self.fast_model = FastToxicityModel.load(path)
+            self.fast_model.metadata["path"] = path
+            self.fast_model.metadata["sha256"] = file_hash(path)
+            self.version = hashlib.sha256((self.lexicon_hash + self.fast_model.metadata["sha256"]).encode("utf-8")).hexdigest()
+            print(f"Fast AI model loaded from {path}")
+        except Exception as e:
+            print(f"Error loading fast AI model {path}: {e}")
+            self.fast_model = None
+    
+    def _build_matchers(self):
+        compile_lexicon(self)
         
     def initialize_ai_models(self):
         self.sentiment_analyzer = TextBlob
-        self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+        if self.snapshot_info is None:
+            self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+            self._toxic_vectors = self.vectorizer.fit_transform(self.toxic_phrases)
         
         if TRANSFORMERS_AVAILABLE:
-            try:
-                self.toxicity_classifier = pipeline(
-                    "text-classification",
-                    model="unitary/toxic-bert",
-                    return_all_scores=True
-                )
-                self.sentiment_classifier = pipeline(
-                    "sentiment-analysis",
-                    model="cardiffnlp/twitter-roberta-base-sentiment-latest"
-                )
-                print("AI models loaded successfully!")
-            except Exception as e:
-                print(f"Error loading transformers: {e}")
-                self.toxicity_classifier = None
-                self.sentiment_classifier = None
-        else:
-            self.toxicity_classifier = None
-            self.sentiment_classifier = None
+            self.models.register("toxicity", self.model_names["toxicity"], "text-classification", return_all_scores=True)
+            self.models.register("sentiment", self.model_names["sentiment"], "sentiment-analysis")
+    
+    @property
+    def toxicity_classifier(self):
+        return self.get_model("toxicity")
+    
+    @property
+    def sentiment_classifier(self):
+        return self.get_model("sentiment")
+    
+    def get_model(self, name: str):
+        if not TRANSFORMERS_AVAILABLE:
+            return None
+        return self.models.get(self.model_names[name])
+    
+    def has_model(self, name: str) -> bool:
+        return TRANSFORMERS_AVAILABLE and self.models.is_available(self.model_names[name])
+    
+    def has_ai_stage(self) -> bool:
+        return self.fast_model is not None or self.has_model("toxicity")
+    
+    def ai_stage_unavailable(self) -> bool:
+        return TRANSFORMERS_AVAILABLE and not self.has_ai_stage()
+    
+    def model_state(self) -> str:
+        if self.fast_model is not None:
+            return "fast"
+        if not TRANSFORMERS_AVAILABLE:
+            return "fallback"
+        return "model" if self.has_model("toxicity") else "unavailable"
+    
+    def _required_model(self, stage: str) -> Optional[str]:
+        if stage == "ai" and self.fast_model is not None:
+            return None
+        return self.STAGE_MODELS.get(stage)
 
-    def analyze_sentence(self, text: str) -> Dict[str, Any]:
+    def get_lexicon(self, language: Optional[str] = None):
+        if not language or language.lower() == self.language:
+            return self
+        return self.language_packs.get(language) or self
+    
+    def lexicon_version(self, language: Optional[str] = None) -> str:
+        lexicon = self.get_lexicon(language)
+        if lexicon is self:
+            return self.version
+        return hashlib.sha256((self.version + lexicon.version).encode("utf-8")).hexdigest()
+    
+    def analyze_sentence(
+        self,
+        text: str,
+        latency_budget_ms: Optional[float] = None,
+        language: Optional[str] = None,
+        profile: Optional[DetectionProfile] = None
+    ) -> Dict[str, Any]:
+        lexicon = self.get_lexicon(language)
+        deadline = None
+        if latency_budget_ms is not None:
+            deadline = time.perf_counter() + latency_budget_ms / 1000.0
+        
         text_lower = text.lower().strip()
-        text_normalized = self._normalize_text(text_lower)
+        state = {
+            "lexicon": lexicon,
+            "text": text,
+            "text_lower": text_lower,
+            "text_normalized": self._normalize_text(text_lower),
+            "toxicity_score": 0.0,
+            "context_score": 0.0,
+            "sentiment_score": 0.0,
+            "ai_toxicity_score": 0.0,
+            "semantic_similarity_score": 0.0,
+            "bypass_score": 0.0,
+            "detected_patterns": [],
+            "detected_words": []
+        }
+        skipped_stages = []
+        request_profile = current_profile()
+        
+        stages = profile.stages if profile is not None else self.STAGES
+        for stage in stages:
+            if stage in lexicon.skip_stages:
+                continue
+            model_name = self._required_model(stage)
+            if deadline is not None:
+                remaining_ms = (deadline - time.perf_counter()) * 1000.0
+                load_ms = 0.0
+                if model_name is not None and TRANSFORMERS_AVAILABLE:
+                    load_ms = self.models.load_estimate_ms(self.model_names[model_name])
+                if remaining_ms < self.stage_costs.estimate(stage) + load_ms:
+                    skipped_stages.append(stage)
+                    if load_ms > 0:
+                        self.models.load_async(self.model_names[model_name])
+                    else:
+                        self.stage_costs.skipped(stage)
+                    continue
+            if model_name is not None:
+                self.get_model(model_name)
+            matches_before = len(state["detected_patterns"]) + len(state["detected_words"])
+            started = time.perf_counter()
+            getattr(self, "_stage_" + stage)(state)
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            self.stage_costs.record(stage, elapsed_ms)
+            if request_profile is not None:
+                matches = len(state["detected_patterns"]) + len(state["detected_words"]) - matches_before
+                request_profile.record_stage(stage, elapsed_ms, self._stage_regex_count(stage, lexicon), matches)
+                if stage == "ai":
+                    request_profile.record_model_tokens(self.count_model_tokens(text))
+        
+        return self._build_result(
+            state["toxicity_score"], state["context_score"], state["sentiment_score"],
+            state["ai_toxicity_score"], state["semantic_similarity_score"], state["bypass_score"],
+            state["detected_patterns"], state["detected_words"], skipped_stages + state.get("failed_stages", []), lexicon.language, profile
+        )
+    
+    def analyze_many(
+        self,
+        texts: List[str],
+        language: Optional[str] = None,
+        profile: Optional[DetectionProfile] = None,
+        keep_details: bool = False
+    ) -> BatchAnalysis:
+        lexicon = self.get_lexicon(language)
+        stages = [stage for stage in (profile.stages if profile is not None else self.STAGES) if stage not in lexicon.skip_stages]
+        pattern_categories = list(lexicon.compiled_patterns) + ["bypass_attempt"]
+        word_categories = list(lexicon.toxic_words)
+        columns = (
+            [component + "_score" for component in COMPONENTS]
+            + ["patterns:" + category for category in pattern_categories]
+            + ["words:" + category for category in word_categories]
+        )
+        pattern_offset = len(COMPONENTS)
+        word_offset = pattern_offset + len(pattern_categories)
+        
+        count = len(texts)
+        features = np.zeros((count, len(columns)))
+        normalized = []
+        details = [] if keep_details else None
+        per_text_stages = [stage for stage in stages if stage in ("patterns", "bypass", "lexicon", "context", "sentiment")]
+        stage_elapsed = {stage: 0.0 for stage in stages}
         
-        toxicity_score = 0.0
-        detected_patterns = []
-        detected_words = []
-        context_score = 0.0
-        sentiment_score = 0.0
-        ai_toxicity_score = 0.0
-        semantic_similarity_score = 0.0
-        bypass_score = 0.0
+        for i, text in enumerate(texts):
+            text_lower = text.lower().strip()
+            state = {
+                "lexicon": lexicon,
+                "text": text,
+                "text_lower": text_lower,
+                "text_normalized": self._normalize_text(text_lower),
+                "toxicity_score": 0.0,
+                "context_score": 0.0,
+                "sentiment_score": 0.0,
+                "ai_toxicity_score": 0.0,
+                "semantic_similarity_score": 0.0,
+                "bypass_score": 0.0,
+                "detected_patterns": [],
+                "detected_words": []
+            }
+            for stage in per_text_stages:
+                started = time.perf_counter()
+                getattr(self, "_stage_" + stage)(state)
+                stage_elapsed[stage] += time.perf_counter() - started
+            
+            normalized.append(state["text_normalized"])
+            features[i, 0] = state["toxicity_score"]
+            features[i, 1] = state["context_score"]
+            features[i, 2] = state["sentiment_score"]
+            features[i, 5] = state["bypass_score"]
+            for entry in state["detected_patterns"]:
+                features[i, pattern_offset + pattern_categories.index(entry["category"])] += 1
+            for entry in state["detected_words"]:
+                features[i, word_offset + word_categories.index(entry["category"])] += 1
+            if keep_details:
+                details.append({
+                    "detected_patterns": state["detected_patterns"],
+                    "detected_words": state["detected_words"]
+                })
+        
+        failed_stages = []
+        if "ai" in stages and self.ai_stage_unavailable():
+            failed_stages.append("ai")
+        elif "ai" in stages and self.has_ai_stage() and count:
+            started = time.perf_counter()
+            try:
+                features[:, 3] = self._score_ai_many(texts, raise_errors=True)
+                stage_elapsed["ai"] = time.perf_counter() - started
+            except Exception as e:
+                print(f"AI analysis error: {e}")
+                failed_stages.append("ai")
+        if "semantic" in stages and lexicon.vectorizer is not None and count:
+            started = time.perf_counter()
+            similarities = cosine_similarity(lexicon.vectorizer.transform(normalized), lexicon._toxic_vectors)
+            best = similarities.max(axis=1)
+            features[:, 4] = np.where(best > 0.2, best, 0.0)
+            stage_elapsed["semantic"] = time.perf_counter() - started
         
-        for category, patterns in self.toxic_patterns.items():
+        if count:
+            for stage, elapsed in stage_elapsed.items():
+                if elapsed:
+                    self.stage_costs.record(stage, elapsed * 1000.0 / count)
+        
+        weights = profile.weights if profile is not None else {component: 1.0 for component in COMPONENTS}
+        total = np.zeros(count)
+        for index, component in enumerate(COMPONENTS):
+            if component in weights:
+                total += weights[component] * features[:, index]
+        final_scores = np.minimum(1.0, total / (profile.divisor if profile is not None else 6.0))
+        is_toxic = final_scores > 0.4
+        severity = np.select(
+            [final_scores >= 0.8, final_scores >= 0.5, final_scores >= 0.3],
+            ["high", "medium", "low"],
+            default="none"
+        )
+        
+        return BatchAnalysis(
+            self, list(texts), columns, features, final_scores, is_toxic, severity,
+            lexicon.language, profile, details, failed_stages
+        )
+    
+    def _stage_regex_count(self, stage: str, lexicon) -> int:
+        if stage == "patterns":
+            return sum(len(patterns) for patterns in lexicon.compiled_patterns.values())
+        if stage == "bypass":
+            return len(lexicon.compiled_bypass_patterns)
+        if stage == "lexicon":
+            return sum(len(words) for words in lexicon.toxic_words.values())
+        if stage == "context":
+            return sum(len(words) for words in lexicon.context_indicators.values())
+        return 0
+    
+    def count_model_tokens(self, text: str) -> int:
+        if self.fast_model is not None:
+            return sum(len(analyzer(text)) for analyzer, _, _ in self.fast_model._analyzers)
+        if TRANSFORMERS_AVAILABLE and self.models.is_resident(self.model_names["toxicity"]):
+            classifier = self.toxicity_classifier
+            if classifier is not None and getattr(classifier, "tokenizer", None) is not None:
+                return len(classifier.tokenizer(text, truncation=True)["input_ids"])
+        return 0
+    
+    def _stage_patterns(self, state: Dict[str, Any]):
+        for category, patterns in state["lexicon"].compiled_patterns.items():
             for pattern in patterns:
-                matches = re.findall(pattern, text_lower, re.IGNORECASE)
+                matches = pattern.findall(state["text_lower"])
                 if matches:
-                    detected_patterns.append({
+                    state["detected_patterns"].append({
                         "category": category,
-                        "pattern": pattern,
+                        "pattern": pattern.pattern,
                         "matches": matches
                     })
-                    toxicity_score += 0.8
-        
-        for pattern in self.bypass_patterns:
-            matches = re.findall(pattern, text_normalized, re.IGNORECASE)
+                    state["toxicity_score"] += 0.8
+    
+    def _stage_bypass(self, state: Dict[str, Any]):
+        for pattern in state["lexicon"].compiled_bypass_patterns:
+            matches = pattern.findall(state["text_normalized"])
             if matches:
-                detected_patterns.append({
+                state["detected_patterns"].append({
                     "category": "bypass_attempt",
-                    "pattern": pattern,
+                    "pattern": pattern.pattern,
                     "matches": matches
                 })
-                bypass_score += 0.9
-        
-        for category, words in self.toxic_words.items():
+                state["bypass_score"] += 0.9
+    
+    def _stage_lexicon(self, state: Dict[str, Any]):
+        lexicon = state["lexicon"]
+        text_normalized = state["text_normalized"]
+        for category, words in lexicon.toxic_words.items():
             for word in words:
-                if re.search(r'\b' + re.escape(word) + r'\b', text_normalized):
-                    if not self._is_safe_context(text_normalized, word):
-                        detected_words.append({
+                if lexicon.word_matchers[word].search(text_normalized):
+                    if not self._is_safe_context(text_normalized, word, lexicon):
+                        state["detected_words"].append({
                             "category": category,
                             "word": word
                         })
-                        toxicity_score += 0.6
-        
-        context_score = self._analyze_context(text_normalized)
-        sentiment_score = self._analyze_sentiment(text_normalized)
-        
-        if self.toxicity_classifier:
-            ai_toxicity_score = self._analyze_with_ai(text)
-        
-        semantic_similarity_score = self._analyze_semantic_similarity(text_normalized)
-        
-        final_score = (toxicity_score + context_score + sentiment_score + ai_toxicity_score + semantic_similarity_score + bypass_score) / 6.0
-        final_score = min(1.0, final_score)
+                        state["toxicity_score"] += 0.6
+    
+    def _stage_context(self, state: Dict[str, Any]):
+        state["context_score"] = self._analyze_context(state["text_normalized"], state["lexicon"])
+    
+    def _stage_sentiment(self, state: Dict[str, Any]):
+        state["sentiment_score"] = self._analyze_sentiment(state["text_normalized"])
+    
+    def _stage_ai(self, state: Dict[str, Any]):
+        if self.ai_stage_unavailable():
+            state.setdefault("failed_stages", []).append("ai")
+        elif self.has_ai_stage():
+            try:
+                state["ai_toxicity_score"] = self._score_ai(state["text"], raise_errors=True)
+            except Exception as e:
+                print(f"AI analysis error: {e}")
+                state.setdefault("failed_stages", []).append("ai")
+    
+    def _stage_semantic(self, state: Dict[str, Any]):
+        state["semantic_similarity_score"] = self._analyze_semantic_similarity(state["text_normalized"], state["lexicon"])
+    
+    def _build_result(
+        self,
+        toxicity_score: float,
+        context_score: float,
+        sentiment_score: float,
+        ai_toxicity_score: float,
+        semantic_similarity_score: float,
+        bypass_score: float,
+        detected_patterns: List[Dict[str, Any]],
+        detected_words: List[Dict[str, str]],
+        skipped_stages: Optional[List[str]] = None,
+        language: Optional[str] = None,
+        profile: Optional[DetectionProfile] = None
+    ) -> Dict[str, Any]:
+        if profile is not None:
+            final_score = profile.combine({
+                "toxicity": toxicity_score,
+                "context": context_score,
+                "sentiment": sentiment_score,
+                "ai_toxicity": ai_toxicity_score,
+                "semantic_similarity": semantic_similarity_score,
+                "bypass": bypass_score
+            })
+        else:
+            final_score = (toxicity_score + context_score + sentiment_score + ai_toxicity_score + semantic_similarity_score + bypass_score) / 6.0
+            final_score = min(1.0, final_score)
         
         return {
             "toxicity_score": float(round(toxicity_score, 3)),
@@ -245,7 +653,11 @@ class AIDetector:
             "detected_patterns": detected_patterns,
             "detected_words": detected_words,
             "is_toxic": bool(final_score > 0.4),
-            "severity": str(self._get_severity(final_score))
+            "severity": str(self._get_severity(final_score)),
+            "degraded": bool(skipped_stages),
+            "skipped_stages": list(skipped_stages or []),
+            "language": language or self.language,
+            "profile": profile.name if profile is not None else "full"
         }
     
     def _normalize_text(self, text: str) -> str:
@@ -254,26 +666,56 @@ class AIDetector:
         text = text.strip()
         return text
     
-    def _analyze_with_ai(self, text: str) -> float:
+    def _score_ai(self, text: str, raise_errors: bool = False) -> float:
+        if self.fast_model is not None:
+            return self.fast_model.score(text)
+        return self._analyze_with_ai(text, raise_errors)
+    
+    def _score_ai_many(self, texts: List[str], raise_errors: bool = False) -> np.ndarray:
+        if self.fast_model is not None:
+            return self.fast_model.score_many(texts)
+        return self._analyze_with_ai_many(texts, raise_errors)
+    
+    def _analyze_with_ai(self, text: str, raise_errors: bool = False) -> float:
         try:
-            if self.toxicity_classifier:
-                results = self.toxicity_classifier(text)
+            classifier = self.toxicity_classifier
+            if classifier:
+                results = classifier(text)
                 toxic_score = 0.0
                 for result in results[0]:
                     if result['label'] in ['toxic', 'hate', 'threat']:
                         toxic_score = max(toxic_score, result['score'])
                 return float(toxic_score)
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"AI analysis error: {e}")
         return 0.0
     
-    def _analyze_semantic_similarity(self, text: str) -> float:
+    def _analyze_with_ai_many(self, texts: List[str], raise_errors: bool = False) -> np.ndarray:
+        scores = np.zeros(len(texts))
+        try:
+            classifier = self.toxicity_classifier
+            if classifier:
+                results = classifier(list(texts))
+                for i, result in enumerate(results):
+                    for entry in result:
+                        if entry['label'] in ['toxic', 'hate', 'threat']:
+                            scores[i] = max(scores[i], entry['score'])
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"AI analysis error: {e}")
+        return scores
+    
+    def _analyze_semantic_similarity(self, text: str, lexicon=None) -> float:
+        lexicon = lexicon or self
         try:
-            if not hasattr(self, '_toxic_vectors'):
-                self._toxic_vectors = self.vectorizer.fit_transform(self.toxic_phrases)
+            if lexicon.vectorizer is None:
+                return 0.0
             
-            text_vector = self.vectorizer.transform([text])
-            similarities = cosine_similarity(text_vector, self._toxic_vectors)
+            text_vector = lexicon.vectorizer.transform([text])
+            similarities = cosine_similarity(text_vector, lexicon._toxic_vectors)
             max_similarity = float(np.max(similarities))
             
             return max_similarity if max_similarity > 0.2 else 0.0
@@ -281,34 +723,29 @@ class AIDetector:
             print(f"Semantic analysis error: {e}")
             return 0.0
     
-    def _is_safe_context(self, text: str, word: str) -> bool:
-        if word in ["hate", "dislike", "bad", "terrible", "awful"]:
+    def _is_safe_context(self, text: str, word: str, lexicon=None) -> bool:
+        lexicon = lexicon or self
+        if word in lexicon.safe_context_words:
             words = text.split()
             for i, w in enumerate(words):
                 if w == word:
-                    if i > 0 and words[i-1] in self.safe_contexts["negations"]:
+                    if i > 0 and words[i-1] in lexicon.safe_contexts["negations"]:
                         return True
-                    if i < len(words) - 1 and words[i+1] in self.safe_contexts["activities"]:
+                    if i < len(words) - 1 and words[i+1] in lexicon.safe_contexts["activities"]:
                         return True
-                    if i < len(words) - 1 and words[i+1] in self.safe_contexts["objects"]:
+                    if i < len(words) - 1 and words[i+1] in lexicon.safe_contexts["objects"]:
                         return True
         return False
     
-    def _analyze_context(self, text: str) -> float:
+    def _analyze_context(self, text: str, lexicon=None) -> float:
+        lexicon = lexicon or self
         score = 0.0
         
-        for category, words in self.context_indicators.items():
+        for category, words in lexicon.context_indicators.items():
             for word in words:
-                if re.search(r'\b' + re.escape(word) + r'\b', text):
-                    if not self._is_safe_context(text, word):
-                        if category == "negative_emotions":
-                            score += 0.3
-                        elif category == "threatening":
-                            score += 0.5
-                        elif category == "discriminatory":
-                            score += 0.7
-                        elif category == "intensifiers":
-                            score += 0.2
+                if lexicon.word_matchers[word].search(text):
+                    if not self._is_safe_context(text, word, lexicon):
+                        score += lexicon.context_weights.get(category, 0.0)
         
         return min(1.0, score)
     
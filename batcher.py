@@ -0,0 +1,101 @@
+import asyncio
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from admission import LaneFull
+
+
+class DetectionBatcher:
+    def __init__(
+        self,
+        detect_fn: Callable[[List[Tuple[str, Dict[str, Any]]]], List[Any]],
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+        max_queue: Optional[int] = None,
+        admit: Optional[Callable[[], Any]] = None
+    ):
+        self.detect_fn = detect_fn
+        self.admit = admit
+        self.max_batch_size = max_batch_size or int(os.getenv("BATCH_MAX_SIZE", 32))
+        self.max_queue = max_queue if max_queue is not None else int(os.getenv("BATCH_MAX_QUEUE", 1024))
+        self.rejected = 0
+        if max_wait_ms is None:
+            max_wait_ms = float(os.getenv("BATCH_MAX_WAIT_MS", 5))
+        self.max_wait = max_wait_ms / 1000.0
+        self._loop = None
+        self._queue = None
+        self._worker = None
+
+    async def submit(self, text: str, **options) -> Dict[str, Any]:
+        self._ensure_started()
+        if self._queue.qsize() >= self.max_queue:
+            self.rejected += 1
+            raise LaneFull("batch", 1)
+        future = self._loop.create_future()
+        await self._queue.put((text, options, future))
+        return await future
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+
+    async def _collect(self) -> List[Tuple[str, Dict[str, Any], asyncio.Future]]:
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return [entry for entry in batch if not entry[2].done()]
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            if not batch:
+                continue
+            try:
+                results = await self._detect([(text, options) for text, options, _ in batch])
+            except Exception as e:
+                results = [e] * len(batch)
+            for (_, _, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    async def _detect(self, items: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        if self.admit is None:
+            return await run_in_threadpool(self.detect_fn, items)
+        async with self.admit():
+            return await run_in_threadpool(self.detect_fn, items)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue": self.max_queue,
+            "max_batch_size": self.max_batch_size,
+            "rejected": self.rejected
+        }
+
+    async def close(self):
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
@@ -0,0 +1,120 @@
+import os
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class ConversationWindow:
+    __slots__ = ("scores", "flags", "head", "count", "total", "last_seen")
+
+    def __init__(self, size: int):
+        self.scores = array("f", bytes(4 * size))
+        self.flags = bytearray(size)
+        self.head = 0
+        self.count = 0
+        self.total = 0
+        self.last_seen = 0.0
+
+    def append(self, score: float, flagged: bool):
+        size = len(self.scores)
+        self.scores[self.head] = score
+        self.flags[self.head] = 1 if flagged else 0
+        self.head = (self.head + 1) % size
+        self.count = min(self.count + 1, size)
+        self.total += 1
+
+    def ordered(self):
+        size = len(self.scores)
+        start = (self.head - self.count) % size
+        return [self.scores[(start + i) % size] for i in range(self.count)]
+
+    def summary(self) -> Dict[str, Any]:
+        scores = self.ordered()
+        n = len(scores)
+        mean = sum(scores) / n
+        trend = 0.0
+        if n > 1:
+            x_mean = (n - 1) / 2.0
+            numerator = sum((i - x_mean) * (score - mean) for i, score in enumerate(scores))
+            denominator = sum((i - x_mean) ** 2 for i in range(n))
+            trend = numerator / denominator
+        return {
+            "messages": n,
+            "total_messages": self.total,
+            "mean_score": round(mean, 3),
+            "max_score": round(max(scores), 3),
+            "flagged_messages": sum(self.flags),
+            "trend": round(trend, 4)
+        }
+
+
+class ConversationStore:
+    def __init__(self, window: Optional[int] = None, max_bytes: Optional[int] = None, idle_seconds: Optional[float] = None):
+        self.window = max(1, window if window is not None else int(os.getenv("CONVERSATION_WINDOW", 50)))
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("CONVERSATION_MAX_MB", 32)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.idle_seconds = idle_seconds if idle_seconds is not None else float(os.getenv("CONVERSATION_IDLE_SECONDS", 3600))
+        self.max_id_length = int(os.getenv("CONVERSATION_MAX_ID_LENGTH", 256))
+        self._conversations: "OrderedDict[str, ConversationWindow]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+        sample = ConversationWindow(self.window)
+        self.window_bytes = (
+            sys.getsizeof(sample)
+            + sys.getsizeof(sample.scores)
+            + sys.getsizeof(sample.flags)
+            + 128
+        )
+
+    def _entry_bytes(self, conversation_id: str) -> int:
+        return self.window_bytes + sys.getsizeof(conversation_id)
+
+    def record(self, conversation_id: str, score: float, flagged: bool) -> Dict[str, Any]:
+        if len(conversation_id) > self.max_id_length:
+            raise ValueError(f"conversation_id is longer than {self.max_id_length} characters")
+        with self._lock:
+            now = time.monotonic()
+            conversation = self._conversations.get(conversation_id)
+            if conversation is None:
+                conversation = ConversationWindow(self.window)
+                self._conversations[conversation_id] = conversation
+                self._bytes += self._entry_bytes(conversation_id)
+            else:
+                self._conversations.move_to_end(conversation_id)
+            conversation.append(score, flagged)
+            conversation.last_seen = now
+            self._evict(now)
+            return {"conversation_id": conversation_id, **conversation.summary()}
+
+    def _evict(self, now: float):
+        while self._conversations:
+            conversation_id, conversation = next(iter(self._conversations.items()))
+            idle = now - conversation.last_seen > self.idle_seconds
+            if not idle and (self._bytes <= self.max_bytes or len(self._conversations) == 1):
+                break
+            del self._conversations[conversation_id]
+            self._bytes -= self._entry_bytes(conversation_id)
+            self.evictions += 1
+
+    def get(self, conversation_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conversation = self._conversations.get(conversation_id)
+            if conversation is None or conversation.count == 0:
+                return None
+            return {"conversation_id": conversation_id, **conversation.summary()}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "conversations": len(self._conversations),
+                "window": self.window,
+                "tracked_bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions
+            }
@@ -0,0 +1,202 @@
+import hashlib
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from ai_detector import AIDetector
+from profiles import DetectionProfile
+from profiling import current_profile
+from verdict_store import VerdictStore, verdict_key
+
+DEFAULT_BAD_WORDS = {
+    "bad", "damn", "hell", "crap", "shit", "fuck", "ass", "bitch", "bastard", 
+    "dick", "pussy", "cock", "whore", "slut", "fucker", "motherfucker",
+    "bullshit", "fucking", "shitty", "asshole", "dumbass", "jackass"
+}
+
+CUSTOM_BAD_WORDS = set()
+ai_detector = AIDetector(snapshot_path=os.getenv("DETECTOR_SNAPSHOT"))
+verdict_store = VerdictStore(os.getenv("VERDICT_STORE_PATH")) if os.getenv("VERDICT_STORE_PATH") else None
+
+def scan_bad_words(
+    text: str,
+    strict_mode: bool = False,
+    language: str = "en",
+    profile: Optional[DetectionProfile] = None
+) -> Dict[str, Any]:
+    lexicon = ai_detector.get_lexicon(language)
+    base_bad_words = DEFAULT_BAD_WORDS if lexicon is ai_detector else lexicon.bad_words
+    all_bad_words = base_bad_words.union(CUSTOM_BAD_WORDS)
+    
+    text_lower = text.lower()
+    
+    profanity_words = []
+    words_checked = 0
+    if profile is None or profile.word_scan:
+        words_checked = len(all_bad_words)
+        for word in all_bad_words:
+            pattern = r'\b' + re.escape(word.lower()) + r'\b'
+            if re.search(pattern, text_lower):
+                profanity_words.append(word)
+    
+    profanity_count = len(profanity_words)
+    has_profanity = profanity_count > 0
+    
+    censored_text = text
+    for word in profanity_words:
+        pattern = re.compile(re.escape(word), re.IGNORECASE)
+        censored_text = pattern.sub('*' * len(word), censored_text)
+    
+    word_count = len(text.split())
+    confidence_score = min(1.0, profanity_count / max(word_count, 1))
+    
+    if strict_mode and has_profanity:
+        confidence_score = min(confidence_score + 0.2, 1.0)
+    
+    return {
+        "has_profanity": has_profanity,
+        "profanity_count": profanity_count,
+        "profanity_words": profanity_words,
+        "censored_text": censored_text,
+        "confidence_score": confidence_score,
+        "words_checked": words_checked
+    }
+
+def merge_analysis(text: str, scan: Dict[str, Any], ai_analysis: Dict[str, Any]) -> Dict[str, Any]:
+    has_profanity = scan["has_profanity"]
+    confidence_score = scan["confidence_score"]
+    censored_text = scan["censored_text"]
+    
+    if ai_analysis["is_toxic"] or ai_analysis["ai_toxicity_score"] > 0.6:
+        has_profanity = True
+        confidence_score = max(confidence_score, ai_analysis["final_score"])
+        censored_text = ai_detector.censor_text(text, ai_analysis)
+    
+    return {
+        "has_profanity": has_profanity,
+        "profanity_count": scan["profanity_count"],
+        "profanity_words": scan["profanity_words"],
+        "censored_text": censored_text,
+        "confidence_score": round(confidence_score, 3),
+        "ai_analysis": ai_analysis
+    }
+
+def detect_profanity(
+    text: str,
+    strict_mode: bool = False,
+    latency_budget_ms: Optional[float] = None,
+    language: str = "en",
+    profile: Optional[DetectionProfile] = None
+) -> Dict[str, Any]:
+    started = time.perf_counter()
+    scan = scan_bad_words(text, strict_mode, language, profile)
+    request_profile = current_profile()
+    if request_profile is not None:
+        request_profile.record_stage(
+            "word_scan", (time.perf_counter() - started) * 1000.0, scan["words_checked"], scan["profanity_count"]
+        )
+    
+    if latency_budget_ms is not None:
+        latency_budget_ms = max(0.0, latency_budget_ms - (time.perf_counter() - started) * 1000.0)
+    ai_analysis = ai_detector.analyze_sentence(text, latency_budget_ms, language, profile)
+    
+    return merge_analysis(text, scan, ai_analysis)
+
+def detect_profanity_many(
+    texts: List[str],
+    strict_mode: bool = False,
+    language: str = "en",
+    profile: Optional[DetectionProfile] = None
+) -> List[Dict[str, Any]]:
+    analyses = ai_detector.analyze_many(texts, language, profile, keep_details=True).to_dicts()
+    return [
+        merge_analysis(text, scan_bad_words(text, strict_mode, language, profile), ai_analysis)
+        for text, ai_analysis in zip(texts, analyses)
+    ]
+
+def bad_words_version() -> str:
+    words = "\n".join(sorted(DEFAULT_BAD_WORDS)) + "\0" + "\n".join(sorted(CUSTOM_BAD_WORDS))
+    return hashlib.sha256(words.encode("utf-8")).hexdigest()
+
+def detection_version(language: str) -> str:
+    return ai_detector.lexicon_version(language) + ai_detector.model_state() + bad_words_version()
+
+def detection_key(text: str, version: str, strict_mode: bool, language: str, profile: Optional[DetectionProfile]) -> str:
+    return verdict_key(text, version, {
+        "strict_mode": strict_mode,
+        "language": language,
+        "profile": [profile.name, profile.describe()] if profile is not None else None
+    })
+
+def detect_profanity_stored(
+    text: str,
+    strict_mode: bool = False,
+    latency_budget_ms: Optional[float] = None,
+    language: str = "en",
+    profile: Optional[DetectionProfile] = None
+) -> Dict[str, Any]:
+    if verdict_store is None:
+        return detect_profanity(text, strict_mode, latency_budget_ms, language, profile)
+    key = detection_key(text, detection_version(language), strict_mode, language, profile)
+    result = verdict_store.get(key)
+    if result is None:
+        result = detect_profanity(text, strict_mode, latency_budget_ms, language, profile)
+        if not result["ai_analysis"]["degraded"]:
+            verdict_store.put(key, result)
+    return result
+
+def detect_profanity_many_stored(
+    texts: List[str],
+    strict_mode: bool = False,
+    language: str = "en",
+    profile: Optional[DetectionProfile] = None
+) -> List[Dict[str, Any]]:
+    if verdict_store is None:
+        return detect_profanity_many(texts, strict_mode, language, profile)
+    version = detection_version(language)
+    keys = [detection_key(text, version, strict_mode, language, profile) for text in texts]
+    found = verdict_store.get_many(keys)
+    missing = [index for index, key in enumerate(keys) if key not in found]
+    if missing:
+        computed = detect_profanity_many([texts[index] for index in missing], strict_mode, language, profile)
+        fresh = {}
+        for index, result in zip(missing, computed):
+            fresh[keys[index]] = result
+        verdict_store.put_many({key: result for key, result in fresh.items() if not result["ai_analysis"]["degraded"]})
+        found.update(fresh)
+    return [found[key] for key in keys]
+
+def detect_profanity_batch(items: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+    results: List[Any] = [None] * len(items)
+    groups: Dict[Tuple[Any, ...], List[int]] = {}
+    budgeted = []
+    for index, (text, options) in enumerate(items):
+        if options.get("deadline") is not None:
+            budgeted.append(index)
+            continue
+        key = (options.get("strict_mode", False), options.get("language", "en"), options.get("profile"))
+        groups.setdefault(key, []).append(index)
+    
+    budgeted.sort(key=lambda index: items[index][1]["deadline"])
+    for index in budgeted:
+        text, options = items[index]
+        try:
+            results[index] = detect_profanity_stored(
+                text,
+                options.get("strict_mode", False),
+                max(0.0, (options["deadline"] - time.perf_counter()) * 1000.0),
+                options.get("language", "en"),
+                options.get("profile")
+            )
+        except Exception as e:
+            results[index] = e
+    
+    for (strict_mode, language, profile), indices in groups.items():
+        try:
+            group_results = detect_profanity_many_stored([items[index][0] for index in indices], strict_mode, language, profile)
+        except Exception as e:
+            group_results = [e] * len(indices)
+        for index, result in zip(indices, group_results):
+            results[index] = result
+    return results
@@ -0,0 +1,179 @@
+import asyncio
+import random
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+
+class AsyncDetectorClient:
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        timeout: float = 10.0,
+        max_connections: int = 100,
+        max_retries: int = 3,
+        backoff_base: float = 0.1,
+        backoff_max: float = 2.0,
+        batch_size: int = 32,
+        batch_window_ms: float = 5.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.batch_size = max(1, batch_size)
+        self.batch_window = batch_window_ms / 1000.0
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            transport=transport
+        )
+        self._pending: Dict[bool, List[Tuple[str, asyncio.Future]]] = {}
+        self._flush_handles: Dict[bool, asyncio.TimerHandle] = {}
+        self._flush_tasks = set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        for strict_mode in list(self._pending):
+            self._flush(strict_mode)
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+        await self.client.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs) -> Any:
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.request(method, path, **kwargs)
+                if response.status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                    await asyncio.sleep(self._backoff(attempt, response.headers.get("Retry-After")))
+                    attempt += 1
+                    continue
+                response.raise_for_status()
+                return response.json()
+            except (httpx.TransportError, httpx.TimeoutException):
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+                attempt += 1
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        delay = min(self.backoff_base * (2 ** attempt), self.backoff_max)
+        return delay * random.uniform(0.5, 1.0)
+
+    async def detect_text(self, text: str, strict_mode: bool = False) -> Dict[str, Any]:
+        if self.batch_size == 1 or self.batch_window <= 0:
+            return await self._request("POST", "/detect", json={"text": text, "strict_mode": strict_mode})
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(strict_mode, [])
+        pending.append((text, future))
+        if len(pending) >= self.batch_size:
+            self._flush(strict_mode)
+        elif strict_mode not in self._flush_handles:
+            self._flush_handles[strict_mode] = loop.call_later(self.batch_window, self._flush, strict_mode)
+        return await future
+
+    def _flush(self, strict_mode: bool):
+        handle = self._flush_handles.pop(strict_mode, None)
+        if handle is not None:
+            handle.cancel()
+        pending = self._pending.pop(strict_mode, [])
+        if not pending:
+            return
+        task = asyncio.ensure_future(self._send_batch(pending, strict_mode))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _send_batch(self, pending: List[Tuple[str, asyncio.Future]], strict_mode: bool):
+        try:
+            if len(pending) == 1:
+                results = [await self._request("POST", "/detect", json={"text": pending[0][0], "strict_mode": strict_mode})]
+            else:
+                results = await self.detect_batch([text for text, _ in pending], strict_mode)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def detect_batch(self, texts: List[str], strict_mode: bool = False) -> List[Dict[str, Any]]:
+        result = await self._request("POST", "/detect-batch", json={"texts": texts, "strict_mode": strict_mode})
+        return result["results"]
+
+    async def add_custom_words(self, words: List[str]) -> Dict[str, Any]:
+        return await self._request("POST", "/custom-words", json={"words": words, "action": "add"})
+
+    async def remove_custom_words(self, words: List[str]) -> Dict[str, Any]:
+        return await self._request("POST", "/custom-words", json={"words": words, "action": "remove"})
+
+    async def get_custom_words(self) -> Dict[str, Any]:
+        return await self._request("GET", "/custom-words")
+
+    async def health_check(self) -> Dict[str, Any]:
+        return await self._request("GET", "/health")
+
+
+class DetectorClient:
+    def __init__(self, base_url: str = "http://localhost:8000", **kwargs):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self._client = self._call(self._create_client(base_url, **kwargs))
+
+    async def _create_client(self, base_url: str, **kwargs) -> AsyncDetectorClient:
+        return AsyncDetectorClient(base_url, **kwargs)
+
+    def _call(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._loop.is_closed():
+            return
+        self._call(self._client.aclose())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def detect_text(self, text: str, strict_mode: bool = False) -> Dict[str, Any]:
+        return self._call(self._client.detect_text(text, strict_mode))
+
+    def detect_batch(self, texts: List[str], strict_mode: bool = False) -> List[Dict[str, Any]]:
+        return self._call(self._client.detect_batch(texts, strict_mode))
+
+    def add_custom_words(self, words: List[str]) -> Dict[str, Any]:
+        return self._call(self._client.add_custom_words(words))
+
+    def remove_custom_words(self, words: List[str]) -> Dict[str, Any]:
+        return self._call(self._client.remove_custom_words(words))
+
+    def get_custom_words(self) -> Dict[str, Any]:
+        return self._call(self._client.get_custom_words())
+
+    def health_check(self) -> Dict[str, Any]:
+        return self._call(self._client.health_check())
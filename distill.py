@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import sklearn
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import Ridge
+from sklearn.model_selection import train_test_split
+from sklearn.utils import murmurhash3_32
+
+FAST_MODEL_VERSION = 1
+CHAR_FEATURES = 2 ** 18
+WORD_FEATURES = 2 ** 16
+
+
+def build_vectorizers(char_features: int = CHAR_FEATURES, word_features: int = WORD_FEATURES):
+    return [
+        HashingVectorizer(analyzer="char_wb", ngram_range=(2, 5), n_features=char_features, alternate_sign=False, norm="l2"),
+        HashingVectorizer(analyzer="word", ngram_range=(1, 2), n_features=word_features, alternate_sign=False, norm="l2")
+    ]
+
+
+class FastToxicityModel:
+    def __init__(self, coef: np.ndarray, intercept: float, char_features: int, word_features: int, metadata: Optional[Dict[str, Any]] = None):
+        self.coef = np.asarray(coef, dtype=np.float32)
+        self.intercept = float(intercept)
+        self.char_features = char_features
+        self.word_features = word_features
+        self.metadata = metadata or {}
+        self.vectorizers = build_vectorizers(char_features, word_features)
+        self._analyzers = [
+            (vectorizer.build_analyzer(), vectorizer.n_features, offset)
+            for vectorizer, offset in zip(self.vectorizers, (0, char_features))
+        ]
+
+    @classmethod
+    def load(cls, path: str) -> "FastToxicityModel":
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data.get("version") != FAST_MODEL_VERSION:
+            raise ValueError(f"Unsupported fast model version {data.get('version')}")
+        coef = np.zeros(data["char_features"] + data["word_features"], dtype=np.float32)
+        coef[data["coef_indices"]] = data["coef_values"]
+        return cls(coef, data["intercept"], data["char_features"], data["word_features"], data.get("metadata"))
+
+    def save(self, path: str):
+        indices = np.flatnonzero(self.coef).astype(np.int32)
+        with open(path, "wb") as f:
+            pickle.dump({
+                "version": FAST_MODEL_VERSION,
+                "coef_indices": indices,
+                "coef_values": self.coef[indices],
+                "intercept": self.intercept,
+                "char_features": self.char_features,
+                "word_features": self.word_features,
+                "metadata": self.metadata
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def transform(self, texts: List[str]):
+        return sparse.hstack([vectorizer.transform(texts) for vectorizer in self.vectorizers], format="csr")
+
+    def score_many(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros(0)
+        return np.clip(self.transform(list(texts)) @ self.coef + self.intercept, 0.0, 1.0)
+
+    def score(self, text: str) -> float:
+        total = self.intercept
+        for analyzer, n_features, offset in self._analyzers:
+            counts: Dict[int, int] = {}
+            for token in analyzer(text):
+                index = abs(murmurhash3_32(token)) % n_features
+                counts[index] = counts.get(index, 0) + 1
+            if not counts:
+                continue
+            values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+            indices = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts)) + offset
+            total += float(self.coef[indices] @ values) / float(np.sqrt(values @ values))
+        return min(1.0, max(0.0, total))
+
+
+def read_corpus(path: str, limit: Optional[int] = None) -> List[str]:
+    texts = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if path.endswith(".jsonl"):
+                line = json.loads(line).get("text", "")
+            if line:
+                texts.append(line)
+            if limit and len(texts) >= limit:
+                break
+    return texts
+
+
+def teacher_scores(detector, texts: List[str]):
+    scores = np.zeros(len(texts))
+    latencies_ms = np.zeros(len(texts))
+    for i, text in enumerate(texts):
+        started = time.perf_counter()
+        scores[i] = detector._analyze_with_ai(text)
+        latencies_ms[i] = (time.perf_counter() - started) * 1000.0
+    return scores, latencies_ms
+
+
+def latency_summary(latencies_ms: np.ndarray) -> Dict[str, float]:
+    return {
+        "mean_ms": round(float(np.mean(latencies_ms)), 4),
+        "p50_ms": round(float(np.percentile(latencies_ms, 50)), 4),
+        "p95_ms": round(float(np.percentile(latencies_ms, 95)), 4)
+    }
+
+
+def compare(model: FastToxicityModel, texts: List[str], teacher: np.ndarray, teacher_latencies_ms: np.ndarray, threshold: float) -> Dict[str, Any]:
+    student = np.zeros(len(texts))
+    student_latencies_ms = np.zeros(len(texts))
+    for i, text in enumerate(texts):
+        started = time.perf_counter()
+        student[i] = model.score(text)
+        student_latencies_ms[i] = (time.perf_counter() - started) * 1000.0
+
+    teacher_toxic = teacher > threshold
+    student_toxic = student > threshold
+    return {
+        "messages": len(texts),
+        "threshold": threshold,
+        "agreement": round(float(np.mean(teacher_toxic == student_toxic)), 4),
+        "toxic_recall": round(float(np.mean(student_toxic[teacher_toxic])), 4) if teacher_toxic.any() else None,
+        "false_positive_rate": round(float(np.mean(student_toxic[~teacher_toxic])), 4) if (~teacher_toxic).any() else None,
+        "mean_absolute_error": round(float(np.mean(np.abs(teacher - student))), 4),
+        "teacher_latency": latency_summary(teacher_latencies_ms),
+        "student_latency": latency_summary(student_latencies_ms)
+    }
+
+
+def train(detector, texts: List[str], alpha: float = 1.0, holdout: float = 0.2, threshold: float = 0.6, seed: int = 42):
+    print(f"🔄 Scoring {len(texts)} messages with {detector.model_names['toxicity']}...")
+    scores, latencies_ms = teacher_scores(detector, texts)
+
+    indices = np.arange(len(texts))
+    train_idx, test_idx = train_test_split(indices, test_size=holdout, random_state=seed) if holdout else (indices, indices)
+
+    model = FastToxicityModel(np.zeros(CHAR_FEATURES + WORD_FEATURES), 0.0, CHAR_FEATURES, WORD_FEATURES)
+    regressor = Ridge(alpha=alpha)
+    regressor.fit(model.transform([texts[i] for i in train_idx]), scores[train_idx])
+    model.coef = regressor.coef_.astype(np.float32)
+    model.intercept = float(regressor.intercept_)
+
+    report = compare(model, [texts[i] for i in test_idx], scores[test_idx], latencies_ms[test_idx], threshold)
+    model.metadata = {
+        "teacher": detector.model_names["toxicity"],
+        "trained_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "training_messages": int(len(train_idx)),
+        "sklearn_version": sklearn.__version__,
+        "report": report
+    }
+    return model, report
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"📊 {report['messages']} held-out messages, threshold {report['threshold']}")
+    print(f"   Agreement: {report['agreement']:.2%}   MAE: {report['mean_absolute_error']}")
+    print(f"   Toxic recall: {report['toxic_recall']}   False positive rate: {report['false_positive_rate']}")
+    print(f"   Teacher latency: {report['teacher_latency']}")
+    print(f"   Student latency: {report['student_latency']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distill the toxicity model into a fast hashed n-gram model")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    train_parser = subparsers.add_parser("train", help="Train a fast model from teacher scores on a corpus")
+    train_parser.add_argument("corpus", help="Text file with one message per line, or .jsonl with a text field")
+    train_parser.add_argument("--output", default=os.getenv("FAST_MODEL_PATH", "fast_model.pkl"))
+    train_parser.add_argument("--limit", type=int, default=None)
+    train_parser.add_argument("--alpha", type=float, default=1.0)
+    train_parser.add_argument("--holdout", type=float, default=0.2)
+    train_parser.add_argument("--threshold", type=float, default=0.6)
+    train_parser.add_argument("--report", default=None, help="Write the comparison report to this JSON file")
+
+    evaluate_parser = subparsers.add_parser("evaluate", help="Compare a trained fast model against the teacher")
+    evaluate_parser.add_argument("corpus")
+    evaluate_parser.add_argument("--model", default=os.getenv("FAST_MODEL_PATH", "fast_model.pkl"))
+    evaluate_parser.add_argument("--limit", type=int, default=None)
+    evaluate_parser.add_argument("--threshold", type=float, default=0.6)
+    evaluate_parser.add_argument("--report", default=None)
+
+    args = parser.parse_args()
+
+    from ai_detector import AIDetector
+
+    detector = AIDetector(fast_model_path="")
+    if not detector.has_model("toxicity") or detector.toxicity_classifier is None:
+        print("❌ The teacher model is not available; install transformers and torch first")
+        return 1
+
+    texts = read_corpus(args.corpus, args.limit)
+    if len(texts) < 10:
+        print(f"❌ Need at least 10 messages in {args.corpus}, found {len(texts)}")
+        return 1
+
+    if args.command == "train":
+        model, report = train(detector, texts, args.alpha, args.holdout, args.threshold)
+        model.save(args.output)
+        print(f"✅ Fast model written to {args.output} ({os.path.getsize(args.output) / 1024:.0f} KB)")
+    else:
+        model = FastToxicityModel.load(args.model)
+        scores, latencies_ms = teacher_scores(detector, texts)
+        report = compare(model, texts, scores, latencies_ms, args.threshold)
+
+    print_report(report)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,71 +1,9 @@
 #!/usr/bin/env python3
 
-import requests
-import json
-import time
-from typing import List, Dict, Any
+import httpx
+from typing import Dict, Any
 
-class BadWordDetectorClient:
-    
-    def __init__(self, base_url: str = "http://localhost:8000"):
-        self.base_url = base_url
-        self.session = requests.Session()
-    
-    def detect_text(self, text: str, strict_mode: bool = False) -> Dict[str, Any]:
-        url = f"{self.base_url}/detect"
-        payload = {
-            "text": text,
-            "strict_mode": strict_mode
-        }
-        
-        response = self.session.post(url, json=payload)
-        response.raise_for_status()
-        return response.json()
-    
-    def detect_batch(self, texts: List[str], strict_mode: bool = False) -> List[Dict[str, Any]]:
-        url = f"{self.base_url}/detect-batch"
-        payload = {
-            "texts": texts,
-            "strict_mode": strict_mode
-        }
-        
-        response = self.session.post(url, json=payload)
-        response.raise_for_status()
-        return response.json()["results"]
-    
-    def add_custom_words(self, words: List[str]) -> Dict[str, Any]:
-        url = f"{self.base_url}/custom-words"
-        payload = {
-            "words": words,
-            "action": "add"
-        }
-        
-        response = self.session.post(url, json=payload)
-        response.raise_for_status()
-        return response.json()
-    
-    def remove_custom_words(self, words: List[str]) -> Dict[str, Any]:
-        url = f"{self.base_url}/custom-words"
-        payload = {
-            "words": words,
-            "action": "remove"
-        }
-        
-        response = self.session.post(url, json=payload)
-        response.raise_for_status()
-        return response.json()
-    
-    def get_custom_words(self) -> Dict[str, Any]:
-        url = f"{self.base_url}/custom-words"
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json()
-    
-    def health_check(self) -> Dict[str, Any]:
-        url = f"{self.base_url}/health"
-        response = self.session.get(url)
-        response.raise_for_status()
-        return response.json()
+from detector_client import DetectorClient
 
 def print_result(title: str, result: Dict[str, Any]):
     print(f"\n{'='*50}")
@@ -86,7 +24,7 @@ def main():
     print("Make sure the server is running on http://localhost:8000")
     print()
     
-    client = BadWordDetectorClient()
+    client = DetectorClient()
     
     try:
         health = client.health_check()
@@ -139,12 +77,14 @@ def main():
         
         print("\n✅ All examples completed successfully!")
         
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("❌ Error: Could not connect to the API server.")
         print("   Make sure the server is running on http://localhost:8000")
         print("   Start the server with: python main.py")
     except Exception as e:
         print(f"❌ Error during execution: {e}")
+    finally:
+        client.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
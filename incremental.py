@@ -0,0 +1,244 @@
+import os
+import re
+import threading
+from bisect import bisect_right, insort
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+WORD_RE = re.compile(r'\w+')
+WORD_CHAR_RE = re.compile(r'\w')
+
+
+class IncrementalAnalysis:
+    def __init__(self, text: str):
+        self.text = text
+        self.word_counts = Counter()
+        self.safe_counts = Counter()
+        self.pattern_matches: Dict[int, List[Tuple[int, str]]] = {}
+        self.signature = None
+        self.model_scores = {
+            "sentiment_score": 0.0,
+            "ai_toxicity_score": 0.0,
+            "semantic_similarity_score": 0.0
+        }
+        self.chars_since_model = 0
+        self.model_refreshed = False
+        self.result: Optional[Dict[str, Any]] = None
+        self.lock = threading.Lock()
+
+
+class IncrementalAnalyzer:
+    def __init__(self, detector, model_refresh_chars: Optional[int] = None, model_refresh_ratio: Optional[float] = None):
+        self.detector = detector
+        if model_refresh_chars is None:
+            model_refresh_chars = int(os.getenv("INCREMENTAL_MODEL_REFRESH_CHARS", 64))
+        if model_refresh_ratio is None:
+            model_refresh_ratio = float(os.getenv("INCREMENTAL_MODEL_REFRESH_RATIO", 0.1))
+        self.model_refresh_chars = model_refresh_chars
+        self.model_refresh_ratio = model_refresh_ratio
+
+        self.pattern_table = []
+        for category, patterns in detector.toxic_patterns.items():
+            for pattern in patterns:
+                self.pattern_table.append((category, pattern, re.compile(pattern, re.IGNORECASE), False))
+        for pattern in detector.bypass_patterns:
+            self.pattern_table.append(("bypass_attempt", pattern, re.compile(pattern, re.IGNORECASE), True))
+
+        self.lexicon = set()
+        for words in detector.toxic_words.values():
+            self.lexicon.update(words)
+        for words in detector.context_indicators.values():
+            self.lexicon.update(words)
+
+        longest_pattern = max((pattern.count(r"\s") + 1 for _, pattern, _, _ in self.pattern_table), default=1)
+        self.margin_tokens = max(longest_pattern, 2) + 1
+
+    def start(self, text: str) -> IncrementalAnalysis:
+        analysis = IncrementalAnalysis(text)
+        words, safe, matches = self._scan(text, 0, len(text))
+        analysis.word_counts.update(words)
+        analysis.safe_counts.update(safe)
+        for index, found in matches.items():
+            analysis.pattern_matches[index] = sorted(found)
+        self._refresh(analysis, force_model=True)
+        return analysis
+
+    def apply_edit(self, analysis: IncrementalAnalysis, offset: int, inserted: str = "", deleted: int = 0) -> Dict[str, Any]:
+        old_text = analysis.text
+        if offset < 0 or deleted < 0 or offset + deleted > len(old_text):
+            raise ValueError(f"Edit out of range for text of length {len(old_text)}")
+
+        new_text = old_text[:offset] + inserted + old_text[offset + deleted:]
+        delta = len(inserted) - deleted
+
+        window_start = self._expand_left(old_text, offset)
+        old_window_end = self._expand_right(old_text, offset + deleted)
+        new_window_end = old_window_end + delta
+
+        old_words, old_safe, old_matches = self._scan(old_text, window_start, old_window_end)
+        new_words, new_safe, new_matches = self._scan(new_text, window_start, new_window_end)
+
+        analysis.word_counts.subtract(old_words)
+        analysis.word_counts.update(new_words)
+        analysis.safe_counts.subtract(old_safe)
+        analysis.safe_counts.update(new_safe)
+
+        for index in set(analysis.pattern_matches) | set(new_matches):
+            current = analysis.pattern_matches.get(index, [])
+            for match in old_matches.get(index, []):
+                if match in current:
+                    current.remove(match)
+            if delta:
+                current = [(position + delta, text) if position >= offset + deleted else (position, text) for position, text in current]
+            for match in new_matches.get(index, []):
+                insort(current, match)
+            if current:
+                analysis.pattern_matches[index] = current
+            else:
+                analysis.pattern_matches.pop(index, None)
+
+        analysis.text = new_text
+        analysis.chars_since_model += len(inserted) + deleted
+        self._refresh(analysis)
+        return analysis.result
+
+    def _expand_left(self, text: str, position: int) -> int:
+        tokens = 0
+        while position > 0 and tokens <= self.margin_tokens:
+            while position > 0 and not WORD_CHAR_RE.match(text[position - 1]):
+                position -= 1
+            if position == 0:
+                break
+            while position > 0 and WORD_CHAR_RE.match(text[position - 1]):
+                position -= 1
+            tokens += 1
+        while position > 0 and not text[position - 1].isspace():
+            position -= 1
+        return position
+
+    def _expand_right(self, text: str, position: int) -> int:
+        tokens = 0
+        length = len(text)
+        while position < length and tokens <= self.margin_tokens:
+            while position < length and not WORD_CHAR_RE.match(text[position]):
+                position += 1
+            if position == length:
+                break
+            while position < length and WORD_CHAR_RE.match(text[position]):
+                position += 1
+            tokens += 1
+        while position < length and not text[position].isspace():
+            position += 1
+        return position
+
+    def _scan(self, text: str, start: int, end: int):
+        window = text[start:end].lower()
+
+        token_matches = list(WORD_RE.finditer(window))
+        tokens = [match.group() for match in token_matches]
+
+        words = Counter()
+        safe = Counter()
+        safe_contexts = self.detector.safe_contexts
+        for i, token in enumerate(tokens):
+            if token not in self.lexicon:
+                continue
+            words[token] += 1
+            if token in self.detector.safe_context_words:
+                if i > 0 and tokens[i - 1] in safe_contexts["negations"]:
+                    safe[token] += 1
+                elif i < len(tokens) - 1 and (tokens[i + 1] in safe_contexts["activities"] or tokens[i + 1] in safe_contexts["objects"]):
+                    safe[token] += 1
+
+        normalized_starts = []
+        position = 0
+        for token in tokens:
+            normalized_starts.append(position)
+            position += len(token) + 1
+        normalized = " ".join(tokens)
+
+        matches: Dict[int, List[Tuple[int, str]]] = {}
+        for index, (_, _, regex, on_normalized) in enumerate(self.pattern_table):
+            source = normalized if on_normalized else window
+            for match in regex.finditer(source):
+                matched = match.group(1) if regex.groups == 1 else match.group(0)
+                if on_normalized:
+                    token_index = bisect_right(normalized_starts, match.start()) - 1
+                    offset = token_matches[token_index].start() + match.start() - normalized_starts[token_index]
+                else:
+                    offset = match.start()
+                matches.setdefault(index, []).append((start + offset, matched))
+
+        return words, safe, matches
+
+    def _refresh(self, analysis: IncrementalAnalysis, force_model: bool = False):
+        detector = self.detector
+
+        toxicity_score = 0.0
+        bypass_score = 0.0
+        detected_patterns = []
+        for index, (category, pattern, _, on_normalized) in enumerate(self.pattern_table):
+            found = analysis.pattern_matches.get(index)
+            if not found:
+                continue
+            detected_patterns.append({
+                "category": category,
+                "pattern": pattern,
+                "matches": [text for _, text in found]
+            })
+            if on_normalized:
+                bypass_score += 0.9
+            else:
+                toxicity_score += 0.8
+
+        detected_words = []
+        for category, words in detector.toxic_words.items():
+            for word in words:
+                if self._is_detected(analysis, word):
+                    detected_words.append({
+                        "category": category,
+                        "word": word
+                    })
+                    toxicity_score += 0.6
+
+        context_score = 0.0
+        for category, words in detector.context_indicators.items():
+            for word in words:
+                if self._is_detected(analysis, word):
+                    context_score += detector.context_weights.get(category, 0.0)
+        context_score = min(1.0, context_score)
+
+        signature = (
+            frozenset(analysis.pattern_matches),
+            frozenset(word for word in analysis.word_counts if self._is_detected(analysis, word))
+        )
+        refresh_model = (
+            force_model
+            or signature != analysis.signature
+            or analysis.chars_since_model >= self.refresh_threshold(analysis.text)
+        )
+        if refresh_model:
+            text_normalized = detector._normalize_text(analysis.text.lower().strip())
+            analysis.model_scores["sentiment_score"] = detector._analyze_sentiment(text_normalized)
+            analysis.model_scores["ai_toxicity_score"] = detector._score_ai(analysis.text) if detector.has_ai_stage() else 0.0
+            analysis.model_scores["semantic_similarity_score"] = detector._analyze_semantic_similarity(text_normalized)
+            analysis.chars_since_model = 0
+        analysis.signature = signature
+        analysis.model_refreshed = refresh_model
+
+        analysis.result = detector._build_result(
+            toxicity_score,
+            context_score,
+            analysis.model_scores["sentiment_score"],
+            analysis.model_scores["ai_toxicity_score"],
+            analysis.model_scores["semantic_similarity_score"],
+            bypass_score,
+            detected_patterns,
+            detected_words
+        )
+
+    def refresh_threshold(self, text: str) -> int:
+        return max(self.model_refresh_chars, int(len(text) * self.model_refresh_ratio))
+
+    def _is_detected(self, analysis: IncrementalAnalysis, word: str) -> bool:
+        return analysis.word_counts[word] > 0 and analysis.safe_counts[word] == 0
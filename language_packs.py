@@ -0,0 +1,178 @@
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+DEFAULT_CONTEXT_WEIGHTS = {
+    "negative_emotions": 0.3,
+    "threatening": 0.5,
+    "discriminatory": 0.7,
+    "intensifiers": 0.2
+}
+
+
+def compile_lexicon(lexicon):
+    lexicon.compiled_patterns = {
+        category: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        for category, patterns in lexicon.toxic_patterns.items()
+    }
+    lexicon.compiled_bypass_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in lexicon.bypass_patterns]
+
+    words = set()
+    for group in lexicon.toxic_words.values():
+        words.update(group)
+    for group in lexicon.context_indicators.values():
+        words.update(group)
+    lexicon.word_matchers = {word: re.compile(r'\b' + re.escape(word) + r'\b') for word in words}
+
+
+def estimate_size(value: Any, seen: Optional[set] = None) -> int:
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, seen) for item in value)
+    elif hasattr(value, "nbytes"):
+        size += int(value.nbytes)
+    elif hasattr(value, "data") and hasattr(value.data, "nbytes"):
+        size += int(value.data.nbytes) + int(value.indices.nbytes) + int(value.indptr.nbytes)
+    return size
+
+
+class LanguagePack:
+    def __init__(self, language: str, data: Dict[str, Any]):
+        self.language = language
+        self.version = hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+        self.toxic_patterns = data.get("toxic_patterns", {})
+        self.toxic_words = {category: set(words) for category, words in data.get("toxic_words", {}).items()}
+        self.context_indicators = data.get("context_indicators", {})
+        self.context_weights = data.get("context_weights", DEFAULT_CONTEXT_WEIGHTS)
+        self.safe_contexts = {"activities": [], "objects": [], "negations": []}
+        self.safe_contexts.update(data.get("safe_contexts", {}))
+        self.safe_context_words = data.get("safe_context_words", [])
+        self.toxic_phrases = data.get("toxic_phrases", [])
+        self.bypass_patterns = data.get("bypass_patterns", [])
+        self.bad_words = set(data.get("bad_words", []))
+        self.skip_stages = data.get("skip_stages", [])
+
+        compile_lexicon(self)
+
+        self.vectorizer = None
+        self._toxic_vectors = None
+        if self.toxic_phrases:
+            self.vectorizer = TfidfVectorizer(max_features=1000, stop_words=data.get("stop_words"))
+            self._toxic_vectors = self.vectorizer.fit_transform(self.toxic_phrases)
+
+        self.size_bytes = estimate_size(data) + estimate_size(self.word_matchers)
+        if self.vectorizer is not None:
+            self.size_bytes += estimate_size(self.vectorizer.vocabulary_) + estimate_size(self._toxic_vectors)
+
+
+class LanguagePackRegistry:
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None, idle_seconds: Optional[float] = None):
+        self.directory = directory or os.getenv("LANGUAGE_PACK_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "lexicons"))
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("LANGUAGE_PACK_MAX_MB", 64)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.idle_seconds = idle_seconds if idle_seconds is not None else float(os.getenv("LANGUAGE_PACK_IDLE_SECONDS", 1800))
+        self._packs: "OrderedDict[str, LanguagePack]" = OrderedDict()
+        self._last_used: Dict[str, float] = {}
+        self._missing = set()
+        self._loading: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    def available(self):
+        try:
+            return sorted(name[:-5] for name in os.listdir(self.directory) if name.endswith(".json"))
+        except OSError:
+            return []
+
+    def get(self, language: str) -> Optional[LanguagePack]:
+        language = os.path.basename(language.lower())
+        pack = self._cached(language)
+        if pack is not None or language in self._missing:
+            return pack
+
+        path = os.path.join(self.directory, f"{language}.json")
+        if not os.path.exists(path):
+            return None
+        with self._lock:
+            loader = self._loading.setdefault(language, threading.Lock())
+        with loader:
+            pack = self._cached(language)
+            if pack is not None or language in self._missing:
+                return pack
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    pack = LanguagePack(language, json.load(f))
+            except Exception as e:
+                print(f"Error loading language pack {language}: {e}")
+                pack = None
+
+            with self._lock:
+                self._loading.pop(language, None)
+                if pack is None:
+                    self._missing.add(language)
+                    return None
+                now = time.monotonic()
+                self._packs[language] = pack
+                self._last_used[language] = now
+                self.loads += 1
+                self._evict(now)
+                return pack
+
+    def _cached(self, language: str) -> Optional[LanguagePack]:
+        with self._lock:
+            pack = self._packs.get(language)
+            if pack is not None:
+                now = time.monotonic()
+                self._packs.move_to_end(language)
+                self._last_used[language] = now
+                self._evict(now)
+            return pack
+
+    def _evict(self, now: float):
+        for language in list(self._packs):
+            if now - self._last_used[language] > self.idle_seconds:
+                self._drop(language)
+        while len(self._packs) > 1 and self.total_bytes() > self.max_bytes:
+            self._drop(next(iter(self._packs)))
+
+    def _drop(self, language: str):
+        self._packs.pop(language, None)
+        self._last_used.pop(language, None)
+        self.evictions += 1
+
+    def total_bytes(self) -> int:
+        return sum(pack.size_bytes for pack in self._packs.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "loaded": {
+                    language: {
+                        "size_bytes": pack.size_bytes,
+                        "idle_seconds": round(now - self._last_used[language], 1)
+                    }
+                    for language, pack in self._packs.items()
+                },
+                "total_bytes": self.total_bytes(),
+                "max_bytes": self.max_bytes,
+                "loads": self.loads,
+                "evictions": self.evictions
+            }
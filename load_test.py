@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+DEFAULT_TEXTS = [
+    "Hello, this is a nice day!",
+    "I don't like you",
+    "You are a moron and I hate you",
+    "Another clean message for testing",
+    "Go to hell, nobody wants you here",
+    "I hate doing homework on weekends",
+    "You piece of shit",
+    "Thanks for the help yesterday, it worked"
+]
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ("detect", "detect-get", "detect-batch"):
+            raise argparse.ArgumentTypeError(f"Unknown endpoint in mix: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100.0 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    latencies = [sample["latency_ms"] for sample in samples if sample["ok"]]
+    errors = sum(1 for sample in samples if not sample["ok"])
+    summary = {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50), 3),
+            "p95": round(percentile(latencies, 95), 3),
+            "p99": round(percentile(latencies, 99), 3),
+            "mean": round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+            "max": round(max(latencies), 3) if latencies else 0.0
+        }
+    }
+    return summary
+
+
+class LoadTester:
+    def __init__(self, client: httpx.AsyncClient, mix: Dict[str, float], texts: List[str], batch_size: int, strict_mode: bool):
+        self.client = client
+        self.endpoints = list(mix)
+        self.weights = [mix[name] for name in self.endpoints]
+        self.texts = texts
+        self.batch_size = batch_size
+        self.strict_mode = strict_mode
+
+    async def send_one(self, scheduled: Optional[float] = None) -> Dict[str, Any]:
+        endpoint = random.choices(self.endpoints, self.weights)[0]
+        start = scheduled if scheduled is not None else time.perf_counter()
+        try:
+            if endpoint == "detect":
+                response = await self.client.post("/detect", json={"text": random.choice(self.texts), "strict_mode": self.strict_mode})
+            elif endpoint == "detect-get":
+                response = await self.client.get("/detect-get", params={"word": random.choice(self.texts), "strict_mode": self.strict_mode})
+            else:
+                texts = [random.choice(self.texts) for _ in range(self.batch_size)]
+                response = await self.client.post("/detect-batch", json={"texts": texts, "strict_mode": self.strict_mode})
+            ok = response.status_code == 200
+            status = response.status_code
+        except httpx.HTTPError as e:
+            ok = False
+            status = type(e).__name__
+        return {
+            "endpoint": endpoint,
+            "ok": ok,
+            "status": status,
+            "latency_ms": (time.perf_counter() - start) * 1000.0
+        }
+
+    async def run_concurrency(self, concurrency: int, duration: float) -> Dict[str, Any]:
+        samples = []
+        deadline = time.perf_counter() + duration
+
+        async def worker():
+            while time.perf_counter() < deadline:
+                samples.append(await self.send_one())
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return self._level({"concurrency": concurrency}, samples, time.perf_counter() - start)
+
+    async def run_rate(self, rate: float, duration: float, max_in_flight: int) -> Dict[str, Any]:
+        samples = []
+        semaphore = asyncio.Semaphore(max_in_flight)
+        tasks = []
+        interval = 1.0 / rate
+        start = time.perf_counter()
+        count = int(rate * duration)
+
+        async def fire(scheduled: float):
+            async with semaphore:
+                samples.append(await self.send_one(scheduled))
+
+        for i in range(count):
+            scheduled = start + i * interval
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(fire(scheduled)))
+        await asyncio.gather(*tasks)
+        return self._level({"target_rps": rate}, samples, time.perf_counter() - start)
+
+    def _level(self, setting: Dict[str, Any], samples: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+        level = dict(setting)
+        level.update(summarize(samples, elapsed))
+        level["by_endpoint"] = {
+            name: summarize([sample for sample in samples if sample["endpoint"] == name], elapsed)
+            for name in self.endpoints
+        }
+        status_counts = {}
+        for sample in samples:
+            key = str(sample["status"])
+            status_counts[key] = status_counts.get(key, 0) + 1
+        level["status_counts"] = status_counts
+        return level
+
+
+def find_saturation(levels: List[Dict[str, Any]], min_gain: float, max_error_rate: float) -> Optional[Dict[str, Any]]:
+    best = None
+    for level in levels:
+        if level["error_rate"] > max_error_rate:
+            break
+        if best is not None and level["throughput_rps"] < best["throughput_rps"] * (1.0 + min_gain):
+            break
+        best = level
+    if best is None:
+        return None
+    key = "concurrency" if "concurrency" in best else "target_rps"
+    return {
+        key: best[key],
+        "throughput_rps": best["throughput_rps"],
+        "p99_ms": best["latency_ms"]["p99"]
+    }
+
+
+def build_client(args) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    if args.url:
+        return httpx.AsyncClient(base_url=args.url.rstrip("/"), timeout=args.timeout, limits=limits)
+    import main
+    main.load_custom_words()
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=main.app),
+        base_url="http://in-process",
+        timeout=args.timeout,
+        limits=limits
+    )
+
+
+async def run(args) -> Dict[str, Any]:
+    texts = DEFAULT_TEXTS
+    if args.texts:
+        with open(args.texts, "r") as f:
+            texts = [line.strip() for line in f if line.strip()]
+
+    levels = []
+    async with build_client(args) as client:
+        tester = LoadTester(client, args.mix, texts, args.batch_size, args.strict_mode)
+        if args.warmup > 0:
+            await tester.run_concurrency(1, args.warmup)
+        if args.rate:
+            for rate in args.rate:
+                print(f"🔄 Running at {rate} req/s for {args.duration}s...")
+                levels.append(await tester.run_rate(rate, args.duration, args.max_connections))
+        else:
+            for concurrency in args.concurrency:
+                print(f"🔄 Running with concurrency {concurrency} for {args.duration}s...")
+                levels.append(await tester.run_concurrency(concurrency, args.duration))
+
+    return {
+        "target": args.url or "in-process",
+        "config": {
+            "mix": args.mix,
+            "duration_s": args.duration,
+            "batch_size": args.batch_size,
+            "strict_mode": args.strict_mode,
+            "texts": len(texts)
+        },
+        "levels": levels,
+        "saturation": find_saturation(levels, args.min_gain, args.max_error_rate)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the Bad Word Detector API")
+    parser.add_argument("--url", help="Base URL of a running server; runs the app in-process when omitted")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("detect=6,detect-get=3,detect-batch=1"), help="Endpoint weights, e.g. detect=6,detect-get=3,detect-batch=1")
+    parser.add_argument("--concurrency", type=lambda v: [int(x) for x in v.split(",")], default=[1, 2, 4, 8, 16, 32], help="Comma-separated concurrency levels to step through")
+    parser.add_argument("--rate", type=lambda v: [float(x) for x in v.split(",")], help="Comma-separated target request rates (req/s); overrides --concurrency")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run each level")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Seconds of warm-up traffic before measuring")
+    parser.add_argument("--batch-size", type=int, default=16, help="Texts per /detect-batch request")
+    parser.add_argument("--strict-mode", action="store_true")
+    parser.add_argument("--texts", help="File with one text per line to sample from")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--max-connections", type=int, default=256)
+    parser.add_argument("--min-gain", type=float, default=0.05, help="Throughput gain below which a level counts as saturated")
+    parser.add_argument("--max-error-rate", type=float, default=0.01, help="Error rate above which a level counts as saturated")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    print(f"\n{'concurrency/rate':>18} {'rps':>10} {'p50':>9} {'p95':>9} {'p99':>9} {'errors':>8}")
+    for level in results["levels"]:
+        setting = level.get("concurrency", level.get("target_rps"))
+        latency = level["latency_ms"]
+        print(f"{setting:>18} {level['throughput_rps']:>10} {latency['p50']:>9} {latency['p95']:>9} {latency['p99']:>9} {level['error_rate']:>8}")
+    print(f"\n📈 Saturation point: {results['saturation']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"💾 Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,35 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, Header, HTTPException, Query, Response, WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
-import re
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, ValidationError
+from typing import List, Dict, Any, Optional, Tuple, Union
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+import asyncio
 import json
 import os
-from ai_detector import AIDetector
+import time
+import uuid
+from admission import AdmissionController, LaneFull
+from batcher import DetectionBatcher
+from conversations import ConversationStore
+from detection import (
+    CUSTOM_BAD_WORDS,
+    ai_detector,
+    detect_profanity,
+    detect_profanity_batch,
+    detect_profanity_many_stored,
+    detect_profanity_stored,
+    detection_key,
+    detection_version,
+    verdict_store
+)
+from incremental import IncrementalAnalysis, IncrementalAnalyzer
+from profiles import DetectionProfile, ProfileRegistry
+from profiling import RequestProfiler
+from shard_pool import ShardPool
+from shadow import ShadowEvaluator
 
 app = FastAPI(
     title="Bad Word Detector API",
@@ -25,6 +49,10 @@ class TextRequest(BaseModel):
     text: str
     language: str = "en"
     strict_mode: bool = False
+    latency_budget_ms: Optional[float] = None
+    profile: Optional[str] = None
+    profiling: bool = False
+    conversation_id: Optional[str] = None
 
 class TextResponse(BaseModel):
     original_text: str
@@ -34,15 +62,42 @@ class TextResponse(BaseModel):
     censored_text: str
     confidence_score: float
     ai_analysis: Optional[Dict[str, Any]] = None
+    profiling: Optional[Dict[str, Any]] = None
+    conversation: Optional[Dict[str, Any]] = None
 
 class BatchTextRequest(BaseModel):
     texts: List[str]
     language: str = "en"
     strict_mode: bool = False
+    latency_budget_ms: Optional[float] = None
+    profile: Optional[str] = None
+    conversation_id: Optional[str] = None
 
 class BatchTextResponse(BaseModel):
     results: List[TextResponse]
 
+class StreamMessage(BaseModel):
+    id: Union[str, int]
+    text: str
+    language: str = "en"
+    strict_mode: bool = False
+    latency_budget_ms: Optional[float] = None
+    profile: Optional[str] = None
+    conversation_id: Optional[str] = None
+
+class IncrementalRequest(BaseModel):
+    handle_id: Optional[str] = None
+    text: Optional[str] = None
+    offset: int = 0
+    inserted: str = ""
+    deleted: int = 0
+
+class IncrementalResponse(BaseModel):
+    handle_id: str
+    text_length: int
+    model_refreshed: bool
+    ai_analysis: Dict[str, Any]
+
 class CustomWordRequest(BaseModel):
     words: List[str]
     action: str = "add"
@@ -51,14 +106,17 @@ class CustomWordResponse(BaseModel):
     message: str
     current_custom_words: List[str]
 
-DEFAULT_BAD_WORDS = {
-    "bad", "damn", "hell", "crap", "shit", "fuck", "ass", "bitch", "bastard", 
-    "dick", "pussy", "cock", "whore", "slut", "fucker", "motherfucker",
-    "bullshit", "fucking", "shitty", "asshole", "dumbass", "jackass"
-}
+detection_profiles = ProfileRegistry()
 
-CUSTOM_BAD_WORDS = set()
-ai_detector = AIDetector()
+WS_MAX_IN_FLIGHT = int(os.getenv("WS_MAX_IN_FLIGHT", 64))
+
+incremental_analyzer = IncrementalAnalyzer(ai_detector)
+INCREMENTAL_HANDLES = OrderedDict()
+INCREMENTAL_MAX_HANDLES = int(os.getenv("INCREMENTAL_MAX_HANDLES", 1000))
+ADMIN_API_KEY = os.getenv("ADMIN_API_KEY")
+MODEL_SWEEP_SECONDS = float(os.getenv("MODEL_SWEEP_SECONDS", 60))
+DETECT_GET_MAX_AGE = int(os.getenv("DETECT_GET_MAX_AGE", 60))
+DETECT_GET_S_MAXAGE = int(os.getenv("DETECT_GET_S_MAXAGE", 300))
 
 def load_custom_words():
     try:
@@ -76,50 +134,111 @@ def save_custom_words():
     except Exception as e:
         print(f"Error saving custom words: {e}")
 
-def detect_profanity(text: str, strict_mode: bool = False) -> Dict[str, Any]:
-    all_bad_words = DEFAULT_BAD_WORDS.union(CUSTOM_BAD_WORDS)
-    
-    text_lower = text.lower()
-    
-    profanity_words = []
-    for word in all_bad_words:
-        pattern = r'\b' + re.escape(word.lower()) + r'\b'
-        if re.search(pattern, text_lower):
-            profanity_words.append(word)
-    
-    profanity_count = len(profanity_words)
-    has_profanity = profanity_count > 0
-    
-    censored_text = text
-    for word in profanity_words:
-        pattern = re.compile(re.escape(word), re.IGNORECASE)
-        censored_text = pattern.sub('*' * len(word), censored_text)
-    
-    word_count = len(text.split())
-    confidence_score = min(1.0, profanity_count / max(word_count, 1))
-    
-    if strict_mode and has_profanity:
-        confidence_score = min(confidence_score + 0.2, 1.0)
-    
-    ai_analysis = ai_detector.analyze_sentence(text)
-    
-    if ai_analysis["is_toxic"] or ai_analysis["ai_toxicity_score"] > 0.6:
-        has_profanity = True
-        confidence_score = max(confidence_score, ai_analysis["final_score"])
-        censored_text = ai_detector.censor_text(text, ai_analysis)
-    
+request_profiler = RequestProfiler()
+conversations = ConversationStore()
+shard_pool = ShardPool()
+shadow = ShadowEvaluator.from_env(ai_detector, detection_profiles)
+admission = AdmissionController()
+detection_batcher = DetectionBatcher(detect_profanity_batch, admit=lambda: admission.slot("interactive"))
+
+@asynccontextmanager
+async def admit(lane: str):
+    try:
+        async with admission.slot(lane):
+            yield
+    except LaneFull as e:
+        raise HTTPException(
+            status_code=429,
+            detail=f"Server busy: {str(e)}, retry later",
+            headers={"Retry-After": str(e.retry_after)}
+        )
+
+def track_conversation(conversation_id: Optional[str], response: TextResponse) -> TextResponse:
+    if conversation_id is not None:
+        try:
+            response.conversation = conversations.record(conversation_id, response.confidence_score, response.has_profanity)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    return response
+
+def build_text_response(text: str, result: Dict[str, Any], profiling: Optional[Dict[str, Any]] = None) -> TextResponse:
+    return TextResponse(
+        original_text=text,
+        has_profanity=result["has_profanity"],
+        profanity_count=result["profanity_count"],
+        profanity_words=result["profanity_words"],
+        censored_text=result["censored_text"],
+        confidence_score=result["confidence_score"],
+        ai_analysis=result["ai_analysis"],
+        profiling=profiling
+    )
+
+def resolve_latency_budget(field_value: Optional[float], header_value: Optional[float]) -> Optional[float]:
+    budget = field_value if field_value is not None else header_value
+    if budget is not None and budget < 0:
+        raise HTTPException(status_code=400, detail="Latency budget must not be negative")
+    return budget
+
+def resolve_profile(requested: Optional[str], api_key: Optional[str]) -> DetectionProfile:
+    try:
+        return detection_profiles.resolve(requested, api_key)
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=f"Unknown detection profile: {e.args[0]}")
+
+def require_admin(x_admin_key: Optional[str]):
+    if ADMIN_API_KEY and x_admin_key != ADMIN_API_KEY:
+        raise HTTPException(status_code=403, detail="Admin key required")
+
+def resolve_profiling(field_value: bool, header_value: Optional[str], x_admin_key: Optional[str]) -> bool:
+    requested = field_value or (header_value or "").lower() in ("1", "true", "yes")
+    if not requested:
+        return False
+    if not request_profiler.enabled:
+        raise HTTPException(status_code=403, detail="Request profiling is disabled on this server")
+    require_admin(x_admin_key)
+    return True
+
+async def sweep_models():
+    while True:
+        await asyncio.sleep(MODEL_SWEEP_SECONDS)
+        await run_in_threadpool(ai_detector.models.sweep)
+
+def detect_get_etag(word: str, strict_mode: bool, language: str, profile: DetectionProfile) -> str:
+    return '"' + detection_key(word, detection_version(language), strict_mode, language, profile)[:40] + '"'
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return any(candidate == "*" or candidate.removeprefix("W/") == etag for candidate in candidates)
+
+def detect_get_cache_headers(etag: str) -> Dict[str, str]:
     return {
-        "has_profanity": has_profanity,
-        "profanity_count": profanity_count,
-        "profanity_words": profanity_words,
-        "censored_text": censored_text,
-        "confidence_score": round(confidence_score, 3),
-        "ai_analysis": ai_analysis
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={DETECT_GET_MAX_AGE}, s-maxage={DETECT_GET_S_MAXAGE}",
+        "Vary": "X-API-Key"
     }
 
+def remaining_budget(budget: Optional[float], started: float) -> Optional[float]:
+    if budget is None:
+        return None
+    return max(0.0, budget - (time.perf_counter() - started) * 1000.0)
+
 @app.on_event("startup")
 async def startup_event():
     load_custom_words()
+    if MODEL_SWEEP_SECONDS > 0:
+        app.state.model_sweeper = asyncio.create_task(sweep_models())
+    shard_pool.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await detection_batcher.close()
+    shard_pool.close()
+    shadow.close()
+    sweeper = getattr(app.state, "model_sweeper", None)
+    if sweeper is not None:
+        sweeper.cancel()
 
 @app.get("/")
 async def root():
@@ -130,67 +249,266 @@ async def root():
             "/detect": "POST - Detect profanity in single text",
             "/detect-get": "GET - Detect profanity with query parameters",
             "/detect-batch": "Detect profanity in multiple texts",
+            "/ws/detect": "WebSocket - Stream messages for detection over one connection",
+            "/detect-incremental": "POST - Re-analyze only the edited part of a previously analyzed text",
             "/custom-words": "Manage custom bad words",
-            "/health": "Health check endpoint"
+            "/health": "Health check endpoint",
+            "/metrics": "GET - Queue lengths, rejection counts and stage timings",
+            "/profiles": "GET - Available detection profiles",
+            "/admin/models": "GET - Model residency, size and last use"
         }
     }
 
 @app.get("/detect-get", response_model=TextResponse)
 async def detect_bad_words_get(
+    response: Response,
     word: str = Query(..., description="Text to check for profanity"),
-    strict_mode: bool = Query(False, description="Enable strict mode for enhanced detection")
+    strict_mode: bool = Query(False, description="Enable strict mode for enhanced detection"),
+    language: str = Query("en", description="Language pack to detect with"),
+    latency_budget_ms: Optional[float] = Query(None, description="Skip analysis stages that would not finish within this many milliseconds"),
+    profile: Optional[str] = Query(None, description="Detection profile selecting which stages run"),
+    profiling: bool = Query(False, description="Return a profiling breakdown of this request"),
+    conversation_id: Optional[str] = Query(None, description="Track rolling scores for this conversation"),
+    x_latency_budget_ms: Optional[float] = Header(None),
+    x_api_key: Optional[str] = Header(None),
+    x_profiling: Optional[str] = Header(None),
+    x_admin_key: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None)
 ):
-    try:
-        result = detect_profanity(word, strict_mode)
-        
-        return TextResponse(
-            original_text=word,
-            has_profanity=result["has_profanity"],
-            profanity_count=result["profanity_count"],
-            profanity_words=result["profanity_words"],
-            censored_text=result["censored_text"],
-            confidence_score=result["confidence_score"],
-            ai_analysis=result["ai_analysis"]
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing text: {str(e)}")
+    budget = resolve_latency_budget(latency_budget_ms, x_latency_budget_ms)
+    detection_profile = resolve_profile(profile, x_api_key)
+    profiling_requested = resolve_profiling(profiling, x_profiling, x_admin_key)
+    started = time.perf_counter()
+    
+    etag = None
+    if not profiling_requested and conversation_id is None:
+        etag = await run_in_threadpool(detect_get_etag, word, strict_mode, language, detection_profile)
+        if etag_matches(etag, if_none_match):
+            return Response(status_code=304, headers=detect_get_cache_headers(etag))
+    
+    async with admit("interactive"):
+        try:
+            detection_started = time.perf_counter()
+            result, report = await run_in_threadpool(
+                request_profiler.run, profiling_requested,
+                {"endpoint": "/detect-get", "text_length": len(word), "language": language, "profile": detection_profile.name},
+                detect_profanity if profiling_requested else detect_profanity_stored, word, strict_mode, remaining_budget(budget, started), language, detection_profile
+            )
+            detection_ms = (time.perf_counter() - detection_started) * 1000.0
+            
+            text_response = build_text_response(word, result, report)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error processing text: {str(e)}")
+    if etag is not None and not result["ai_analysis"]["degraded"]:
+        response.headers.update(detect_get_cache_headers(etag))
+    else:
+        response.headers["Cache-Control"] = "no-store"
+    if not profiling_requested:
+        shadow.observe(word, result["ai_analysis"], detection_ms, language, detection_profile)
+    return track_conversation(conversation_id, text_response)
 
 @app.post("/detect", response_model=TextResponse)
-async def detect_bad_words(request: TextRequest):
-    try:
-        result = detect_profanity(request.text, request.strict_mode)
-        
-        return TextResponse(
-            original_text=request.text,
-            has_profanity=result["has_profanity"],
-            profanity_count=result["profanity_count"],
-            profanity_words=result["profanity_words"],
-            censored_text=result["censored_text"],
-            confidence_score=result["confidence_score"],
-            ai_analysis=result["ai_analysis"]
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing text: {str(e)}")
+async def detect_bad_words(
+    request: TextRequest,
+    x_latency_budget_ms: Optional[float] = Header(None),
+    x_api_key: Optional[str] = Header(None),
+    x_profiling: Optional[str] = Header(None),
+    x_admin_key: Optional[str] = Header(None)
+):
+    budget = resolve_latency_budget(request.latency_budget_ms, x_latency_budget_ms)
+    detection_profile = resolve_profile(request.profile, x_api_key)
+    profiling_requested = resolve_profiling(request.profiling, x_profiling, x_admin_key)
+    started = time.perf_counter()
+    async with admit("interactive"):
+        try:
+            detection_started = time.perf_counter()
+            result, report = await run_in_threadpool(
+                request_profiler.run, profiling_requested,
+                {"endpoint": "/detect", "text_length": len(request.text), "language": request.language, "profile": detection_profile.name},
+                detect_profanity if profiling_requested else detect_profanity_stored, request.text, request.strict_mode, remaining_budget(budget, started),
+                request.language, detection_profile
+            )
+            detection_ms = (time.perf_counter() - detection_started) * 1000.0
+            
+            response = build_text_response(request.text, result, report)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error processing text: {str(e)}")
+    if not profiling_requested:
+        shadow.observe(request.text, result["ai_analysis"], detection_ms, request.language, detection_profile)
+    return track_conversation(request.conversation_id, response)
 
 @app.post("/detect-batch", response_model=BatchTextResponse)
-async def detect_bad_words_batch(request: BatchTextRequest):
-    try:
+async def detect_bad_words_batch(
+    request: BatchTextRequest,
+    x_latency_budget_ms: Optional[float] = Header(None),
+    x_api_key: Optional[str] = Header(None)
+):
+    budget = resolve_latency_budget(request.latency_budget_ms, x_latency_budget_ms)
+    detection_profile = resolve_profile(request.profile, x_api_key)
+    started = time.perf_counter()
+    
+    def run_batch():
+        if budget is None:
+            results = detect_profanity_many_stored(request.texts, request.strict_mode, request.language, detection_profile)
+            return [build_text_response(text, result) for text, result in zip(request.texts, results)]
         results = []
         for text in request.texts:
-            result = detect_profanity(text, request.strict_mode)
-            results.append(TextResponse(
-                original_text=text,
-                has_profanity=result["has_profanity"],
-                profanity_count=result["profanity_count"],
-                profanity_words=result["profanity_words"],
-                censored_text=result["censored_text"],
-                confidence_score=result["confidence_score"],
-                ai_analysis=result["ai_analysis"]
-            ))
-        
-        return BatchTextResponse(results=results)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing batch: {str(e)}")
+            result = detect_profanity_stored(
+                text, request.strict_mode, remaining_budget(budget, started), request.language, detection_profile
+            )
+            results.append(build_text_response(text, result))
+        return results
+    
+    async def run_sharded():
+        results = await shard_pool.run(
+            request.texts, request.strict_mode, request.language, detection_profile, set(CUSTOM_BAD_WORDS)
+        )
+        failed = [index for index, result in enumerate(results) if isinstance(result, BaseException)]
+        if failed:
+            retried = await run_in_threadpool(
+                detect_profanity_many_stored, [request.texts[index] for index in failed],
+                request.strict_mode, request.language, detection_profile
+            )
+            for index, result in zip(failed, retried):
+                results[index] = result
+        return [build_text_response(text, result) for text, result in zip(request.texts, results)]
+    
+    async with admit("bulk"):
+        try:
+            if budget is None and shard_pool.should_shard(request.texts):
+                results = await run_sharded()
+            else:
+                results = await run_in_threadpool(run_batch)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Error processing batch: {str(e)}")
+    for response in results:
+        track_conversation(request.conversation_id, response)
+    return BatchTextResponse(results=results)
+
+def start_incremental(text: str) -> Tuple[str, IncrementalAnalysis, IncrementalResponse]:
+    handle_id = uuid.uuid4().hex
+    analysis = incremental_analyzer.start(text)
+    return handle_id, analysis, incremental_response(handle_id, analysis)
+
+def edit_incremental(handle_id: str, analysis: IncrementalAnalysis, offset: int, inserted: str, deleted: int) -> IncrementalResponse:
+    with analysis.lock:
+        incremental_analyzer.apply_edit(analysis, offset, inserted, deleted)
+        return incremental_response(handle_id, analysis)
+
+def incremental_response(handle_id: str, analysis: IncrementalAnalysis) -> IncrementalResponse:
+    return IncrementalResponse(
+        handle_id=handle_id,
+        text_length=len(analysis.text),
+        model_refreshed=analysis.model_refreshed,
+        ai_analysis=analysis.result
+    )
+
+@app.post("/detect-incremental", response_model=IncrementalResponse)
+async def detect_bad_words_incremental(request: IncrementalRequest):
+    if request.handle_id is None:
+        if request.text is None:
+            raise HTTPException(status_code=400, detail="Provide text to start a new analysis")
+        async with admit("interactive"):
+            handle_id, analysis, response = await run_in_threadpool(start_incremental, request.text)
+        INCREMENTAL_HANDLES[handle_id] = analysis
+        while len(INCREMENTAL_HANDLES) > INCREMENTAL_MAX_HANDLES:
+            INCREMENTAL_HANDLES.popitem(last=False)
+        return response
+    
+    analysis = INCREMENTAL_HANDLES.get(request.handle_id)
+    if analysis is None:
+        raise HTTPException(status_code=404, detail="Unknown or expired handle_id")
+    INCREMENTAL_HANDLES.move_to_end(request.handle_id)
+    async with admit("interactive"):
+        try:
+            return await run_in_threadpool(
+                edit_incremental, request.handle_id, analysis, request.offset, request.inserted, request.deleted
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+@app.websocket("/ws/detect")
+async def detect_bad_words_stream(websocket: WebSocket):
+    await websocket.accept()
+    api_key = websocket.headers.get("x-api-key")
+    send_lock = asyncio.Lock()
+    in_flight = set()
+    
+    async def send(payload: Dict[str, Any]):
+        async with send_lock:
+            await websocket.send_json(payload)
+    
+    async def process(message: StreamMessage, profile: DetectionProfile, deadline: Optional[float]):
+        try:
+            detection_started = time.perf_counter()
+            result = await detection_batcher.submit(
+                message.text,
+                strict_mode=message.strict_mode,
+                deadline=deadline,
+                language=message.language,
+                profile=profile
+            )
+            detection_ms = (time.perf_counter() - detection_started) * 1000.0
+            response = build_text_response(message.text, result)
+            shadow.observe(message.text, result["ai_analysis"], detection_ms, message.language, profile)
+            if message.conversation_id is not None:
+                response.conversation = conversations.record(
+                    message.conversation_id, response.confidence_score, response.has_profanity
+                )
+            payload = {"id": message.id, "result": jsonable_encoder(response)}
+        except LaneFull as e:
+            payload = {
+                "id": message.id,
+                "error": f"Server busy: {str(e)}, retry later",
+                "status_code": 429,
+                "retry_after": e.retry_after
+            }
+        except Exception as e:
+            payload = {"id": message.id, "error": f"Error processing text: {str(e)}"}
+        try:
+            await send(payload)
+        except Exception:
+            pass
+    
+    try:
+        while True:
+            raw = await websocket.receive_text()
+            received = time.perf_counter()
+            try:
+                data = json.loads(raw)
+                items = data.get("messages", [data]) if isinstance(data, dict) else data
+                messages = [StreamMessage(**item) for item in items]
+            except (ValueError, TypeError, AttributeError, ValidationError) as e:
+                await send({"error": f"Invalid message: {str(e)}"})
+                continue
+            
+            for message in messages:
+                if len(in_flight) >= WS_MAX_IN_FLIGHT:
+                    await send({
+                        "id": message.id,
+                        "error": f"Too many in-flight messages (limit {WS_MAX_IN_FLIGHT})",
+                        "status_code": 429
+                    })
+                    continue
+                try:
+                    profile = detection_profiles.resolve(message.profile, api_key)
+                except KeyError as e:
+                    await send({"id": message.id, "error": f"Unknown detection profile: {e.args[0]}", "status_code": 400})
+                    continue
+                try:
+                    budget = resolve_latency_budget(message.latency_budget_ms, None)
+                except HTTPException as e:
+                    await send({"id": message.id, "error": e.detail, "status_code": e.status_code})
+                    continue
+                deadline = received + budget / 1000.0 if budget is not None else None
+                task = asyncio.create_task(process(message, profile, deadline))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in list(in_flight):
+            task.cancel()
 
 @app.post("/custom-words", response_model=CustomWordResponse)
 async def manage_custom_words(request: CustomWordRequest):
@@ -226,9 +544,35 @@ async def health_check():
         "status": "healthy",
         "custom_words_count": len(CUSTOM_BAD_WORDS),
         "profanity_filter_loaded": True,
-        "ai_detector_loaded": True
+        "ai_detector_loaded": True,
+        "stage_cost_estimates_ms": ai_detector.stage_costs.snapshot()
+    }
+
+@app.get("/profiles")
+async def get_profiles():
+    return detection_profiles.describe()
+
+@app.get("/metrics")
+async def metrics():
+    return {
+        "admission": admission.stats(),
+        "batcher": detection_batcher.stats(),
+        "stage_cost_estimates_ms": ai_detector.stage_costs.snapshot(),
+        "language_packs": ai_detector.language_packs.stats(),
+        "profiling": request_profiler.stats(),
+        "verdict_store": await run_in_threadpool(verdict_store.stats) if verdict_store is not None else None,
+        "shard_pool": shard_pool.stats(),
+        "conversations": conversations.stats(),
+        "shadow": shadow.stats()
     }
 
+@app.get("/admin/models")
+async def admin_models(x_admin_key: Optional[str] = Header(None)):
+    require_admin(x_admin_key)
+    stats = ai_detector.models.stats()
+    stats["fast_model"] = ai_detector.fast_model.metadata if ai_detector.fast_model is not None else None
+    return stats
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
@@ -0,0 +1,194 @@
+import gc
+import math
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+def load_pipeline(task: str, model_id: str, **kwargs):
+    from transformers import pipeline
+    return pipeline(task, model=model_id, **kwargs)
+
+
+def model_size_bytes(model: Any) -> int:
+    module = getattr(model, "model", model)
+    if hasattr(module, "parameters"):
+        size = sum(p.numel() * p.element_size() for p in module.parameters())
+        if hasattr(module, "buffers"):
+            size += sum(b.numel() * b.element_size() for b in module.buffers())
+        return int(size)
+    return int(getattr(model, "size_bytes", sys.getsizeof(model)))
+
+
+class ModelEntry:
+    def __init__(self, model_id: str, task: str, kwargs: Dict[str, Any]):
+        self.model_id = model_id
+        self.task = task
+        self.kwargs = kwargs
+        self.names = set()
+        self.model = None
+        self.size_bytes = 0
+        self.last_used: Optional[float] = None
+        self.loaded_at: Optional[float] = None
+        self.load_ms: Optional[float] = None
+        self.loads = 0
+        self.unloads = 0
+        self.error: Optional[str] = None
+        self.loading = False
+        self.load_lock = threading.Lock()
+
+
+class ModelRegistry:
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        idle_seconds: Optional[float] = None,
+        loader: Optional[Callable[..., Any]] = None
+    ):
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("MODEL_MEMORY_BUDGET_MB", 2048)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.idle_seconds = idle_seconds if idle_seconds is not None else float(os.getenv("MODEL_IDLE_SECONDS", 900))
+        self.loader = loader or load_pipeline
+        self._entries: Dict[str, ModelEntry] = {}
+        self._resident: "OrderedDict[str, ModelEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def register(self, name: str, model_id: str, task: str, **kwargs) -> str:
+        with self._lock:
+            entry = self._entries.get(model_id)
+            if entry is None:
+                entry = ModelEntry(model_id, task, kwargs)
+                self._entries[model_id] = entry
+            entry.names.add(name)
+        return model_id
+
+    def is_resident(self, model_id: str) -> bool:
+        entry = self._entries.get(model_id)
+        return entry is not None and entry.model is not None
+
+    def is_available(self, model_id: str) -> bool:
+        entry = self._entries.get(model_id)
+        return entry is not None and entry.error is None
+
+    def load_estimate_ms(self, model_id: str) -> float:
+        entry = self._entries.get(model_id)
+        if entry is None or entry.model is not None or entry.error is not None:
+            return 0.0
+        return entry.load_ms if entry.load_ms is not None else math.inf
+
+    def load_async(self, model_id: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(model_id)
+            if entry is None or entry.model is not None or entry.error is not None or entry.loading:
+                return False
+            entry.loading = True
+        threading.Thread(target=self._load_in_background, args=(entry,), name=f"load-{model_id}", daemon=True).start()
+        return True
+
+    def _load_in_background(self, entry: ModelEntry):
+        try:
+            self.get(entry.model_id)
+        finally:
+            entry.loading = False
+
+    def get(self, model_id: str):
+        with self._lock:
+            entry = self._entries.get(model_id)
+            if entry is None or entry.error is not None:
+                return None
+            entry.last_used = time.time()
+            model = entry.model
+            if model is not None:
+                self._resident.move_to_end(model_id)
+                return model
+
+        with entry.load_lock:
+            if entry.model is None and entry.error is None:
+                self._load(entry)
+            model = entry.model
+
+        with self._lock:
+            self._evict(keep=model_id)
+        return model
+
+    def _load(self, entry: ModelEntry):
+        started = time.perf_counter()
+        try:
+            model = self.loader(entry.task, entry.model_id, **entry.kwargs)
+        except Exception as e:
+            print(f"Error loading model {entry.model_id}: {e}")
+            entry.error = str(e)
+            return
+        entry.load_ms = (time.perf_counter() - started) * 1000.0
+        entry.size_bytes = model_size_bytes(model)
+        entry.loaded_at = time.time()
+        entry.loads += 1
+        with self._lock:
+            entry.model = model
+            self._resident[entry.model_id] = entry
+        print(f"Loaded model {entry.model_id} in {entry.load_ms:.0f} ms")
+
+    def _evict(self, keep: Optional[str] = None):
+        now = time.time()
+        if self.idle_seconds > 0:
+            for model_id, entry in list(self._resident.items()):
+                if model_id != keep and now - entry.last_used > self.idle_seconds:
+                    self._unload(entry)
+        for model_id, entry in list(self._resident.items()):
+            if self.total_bytes() <= self.max_bytes:
+                break
+            if model_id != keep:
+                self._unload(entry)
+
+    def _unload(self, entry: ModelEntry):
+        self._resident.pop(entry.model_id, None)
+        entry.model = None
+        entry.unloads += 1
+        gc.collect()
+
+    def sweep(self):
+        with self._lock:
+            self._evict()
+
+    def unload(self, model_id: str) -> bool:
+        with self._lock:
+            entry = self._resident.get(model_id)
+            if entry is None:
+                return False
+            self._unload(entry)
+            return True
+
+    def total_bytes(self) -> int:
+        return sum(entry.size_bytes for entry in self._resident.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            now = time.time()
+            return {
+                "models": {
+                    model_id: {
+                        "names": sorted(entry.names),
+                        "task": entry.task,
+                        "resident": entry.model is not None,
+                        "loading": entry.loading,
+                        "size_bytes": entry.size_bytes if entry.model is not None else 0,
+                        "last_used": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(entry.last_used)) if entry.last_used else None,
+                        "idle_seconds": round(now - entry.last_used, 1) if entry.last_used else None,
+                        "load_ms": round(entry.load_ms, 1) if entry.load_ms is not None else None,
+                        "loads": entry.loads,
+                        "unloads": entry.unloads,
+                        "error": entry.error
+                    }
+                    for model_id, entry in self._entries.items()
+                },
+                "resident_bytes": self.total_bytes(),
+                "max_bytes": self.max_bytes,
+                "idle_seconds": self.idle_seconds
+            }
+
+
+shared_models = ModelRegistry()
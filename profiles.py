@@ -0,0 +1,110 @@
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+STAGE_COMPONENTS = {
+    "patterns": "toxicity",
+    "lexicon": "toxicity",
+    "bypass": "bypass",
+    "context": "context",
+    "sentiment": "sentiment",
+    "ai": "ai_toxicity",
+    "semantic": "semantic_similarity"
+}
+
+ALL_STAGES = ["patterns", "bypass", "lexicon", "context", "sentiment", "ai", "semantic"]
+
+COMPONENTS = ["toxicity", "context", "sentiment", "ai_toxicity", "semantic_similarity", "bypass"]
+
+
+class DetectionProfile:
+    def __init__(
+        self,
+        name: str,
+        stages: List[str],
+        weights: Optional[Dict[str, float]] = None,
+        divisor: Optional[float] = None,
+        word_scan: bool = True
+    ):
+        unknown = [stage for stage in stages if stage not in STAGE_COMPONENTS]
+        if unknown:
+            raise ValueError(f"Unknown stages in profile {name}: {', '.join(unknown)}")
+        self.name = name
+        self.stages = [stage for stage in ALL_STAGES if stage in stages]
+        selected = {STAGE_COMPONENTS[stage] for stage in self.stages}
+        self.weights = {component: 1.0 for component in COMPONENTS if component in selected}
+        if weights:
+            unknown = [component for component in weights if component not in COMPONENTS]
+            if unknown:
+                raise ValueError(f"Unknown score weights in profile {name}: {', '.join(unknown)}")
+            self.weights.update({component: float(weight) for component, weight in weights.items() if component in self.weights})
+        self.divisor = float(divisor) if divisor else (sum(self.weights.values()) or 1.0)
+        self.word_scan = word_scan
+
+    def combine(self, components: Dict[str, float]) -> float:
+        total = sum(weight * components.get(component, 0.0) for component, weight in self.weights.items())
+        return min(1.0, total / self.divisor)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "stages": self.stages,
+            "weights": self.weights,
+            "divisor": self.divisor,
+            "word_scan": self.word_scan
+        }
+
+
+BUILTIN_PROFILES = {
+    "lexical": DetectionProfile("lexical", ["patterns", "bypass", "lexicon"]),
+    "standard": DetectionProfile("standard", ["patterns", "bypass", "lexicon", "context", "ai"]),
+    "full": DetectionProfile("full", ALL_STAGES)
+}
+
+
+class ProfileRegistry:
+    def __init__(self, path: Optional[str] = None):
+        self.profiles = dict(BUILTIN_PROFILES)
+        self.api_keys: Dict[str, str] = {}
+        self.default = "full"
+
+        path = path or os.getenv("DETECTION_PROFILES_FILE", "detection_profiles.json")
+        if os.path.exists(path):
+            self._load(path)
+        self.default = os.getenv("DEFAULT_DETECTION_PROFILE", self.default)
+        if self.default not in self.profiles:
+            print(f"Unknown default detection profile {self.default}, using full")
+            self.default = "full"
+
+    def _load(self, path: str):
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Error loading detection profiles: {e}")
+            return
+
+        for name, config in data.get("profiles", {}).items():
+            try:
+                self.profiles[name] = DetectionProfile(
+                    name,
+                    config.get("stages", ALL_STAGES),
+                    config.get("weights"),
+                    config.get("divisor"),
+                    config.get("word_scan", True)
+                )
+            except ValueError as e:
+                print(f"Error loading detection profile {name}: {e}")
+        self.api_keys.update(data.get("api_keys", {}))
+        self.default = data.get("default", self.default)
+
+    def resolve(self, requested: Optional[str] = None, api_key: Optional[str] = None) -> DetectionProfile:
+        name = requested or self.api_keys.get(api_key or "") or self.default
+        if name not in self.profiles:
+            raise KeyError(name)
+        return self.profiles[name]
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "default": self.default,
+            "profiles": {name: profile.describe() for name, profile in self.profiles.items()}
+        }
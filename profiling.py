@@ -0,0 +1,160 @@
+import contextvars
+import cProfile
+import json
+import logging
+import os
+import pstats
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_active_profile: contextvars.ContextVar = contextvars.ContextVar("active_profile", default=None)
+
+
+def current_profile() -> Optional["RequestProfile"]:
+    return _active_profile.get()
+
+
+class RequestProfile:
+    def __init__(self, top_functions: int = 15):
+        self.top_functions = top_functions
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self.model_tokens = 0
+        self.started = time.perf_counter()
+        self.wall_ms = 0.0
+        self.profiler = cProfile.Profile()
+        self.profiling_functions = False
+
+    def record_stage(self, stage: str, elapsed_ms: float, regexes: int = 0, matches: int = 0):
+        entry = self.stages.setdefault(stage, {"wall_ms": 0.0, "regexes": 0, "matches": 0})
+        entry["wall_ms"] += elapsed_ms
+        entry["regexes"] += regexes
+        entry["matches"] += matches
+
+    def record_model_tokens(self, count: int):
+        self.model_tokens += count
+
+    def functions(self) -> List[Dict[str, Any]]:
+        if not self.profiling_functions:
+            return []
+        stats = pstats.Stats(self.profiler)
+        rows = []
+        for (filename, line, function), (_, calls, total, cumulative, _) in stats.stats.items():
+            rows.append({
+                "function": f"{os.path.basename(filename)}:{line}({function})",
+                "calls": calls,
+                "total_ms": round(total * 1000.0, 3),
+                "cumulative_ms": round(cumulative * 1000.0, 3)
+            })
+        rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+        return rows[:self.top_functions]
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "wall_ms": round(self.wall_ms, 3),
+            "stages": {
+                stage: {
+                    "wall_ms": round(entry["wall_ms"], 3),
+                    "regexes": entry["regexes"],
+                    "matches": entry["matches"]
+                }
+                for stage, entry in self.stages.items()
+            },
+            "model_tokens": self.model_tokens,
+            "top_functions": self.functions()
+        }
+
+
+class RequestProfiler:
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        sample_rate: Optional[int] = None,
+        log_file: Optional[str] = None
+    ):
+        if enabled is None:
+            enabled = os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+        self.enabled = enabled
+        self.sample_rate = sample_rate if sample_rate is not None else int(os.getenv("PROFILING_SAMPLE_RATE", 0))
+        self.log_file = log_file or os.getenv("PROFILING_LOG_FILE", "profiles/profiles.jsonl")
+        self.top_functions = int(os.getenv("PROFILING_TOP_FUNCTIONS", 15))
+        self.profiled = 0
+        self.sampled = 0
+        self._seen = 0
+        self._lock = threading.Lock()
+        self._logger = None
+
+    def should_sample(self) -> bool:
+        if self.sample_rate <= 0:
+            return False
+        with self._lock:
+            self._seen += 1
+            return self._seen % self.sample_rate == 0
+
+    def _get_logger(self) -> logging.Logger:
+        with self._lock:
+            return self._logger or self._create_logger()
+
+    def _create_logger(self) -> logging.Logger:
+        if self._logger is None:
+            directory = os.path.dirname(self.log_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            logger = logging.getLogger(f"profiling.{id(self)}")
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+            handler = RotatingFileHandler(
+                self.log_file,
+                maxBytes=int(float(os.getenv("PROFILING_LOG_MAX_MB", 10)) * 1024 * 1024),
+                backupCount=int(os.getenv("PROFILING_LOG_BACKUPS", 5))
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            logger.addHandler(handler)
+            self._logger = logger
+        return self._logger
+
+    def run(self, requested: bool, context: Dict[str, Any], fn: Callable[..., Any], *args) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        sampled = self.should_sample()
+        if not (requested or sampled):
+            return fn(*args), None
+
+        profile = RequestProfile(self.top_functions)
+        token = _active_profile.set(profile)
+        try:
+            profile.profiler.enable()
+            profile.profiling_functions = True
+        except ValueError as e:
+            print(f"Function profiling unavailable for this request: {e}")
+        try:
+            result = fn(*args)
+        finally:
+            if profile.profiling_functions:
+                profile.profiler.disable()
+            profile.wall_ms = (time.perf_counter() - profile.started) * 1000.0
+            _active_profile.reset(token)
+
+        report = profile.report()
+        with self._lock:
+            self.profiled += 1
+            if sampled:
+                self.sampled += 1
+        if sampled:
+            try:
+                self._get_logger().info(json.dumps({
+                    "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                    **context,
+                    **report
+                }))
+            except Exception as e:
+                print(f"Error writing profile: {e}")
+        return result, report if requested else None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "profiled": self.profiled,
+            "sampled": self.sampled,
+            "log_file": self.log_file if self.sample_rate > 0 else None
+        }
@@ -0,0 +1,184 @@
+import importlib
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from model_registry import ModelRegistry
+from profiles import COMPONENTS
+
+
+class ProfileCandidate:
+    def __init__(self, detector, profile):
+        self.detector = detector
+        self.profile = profile
+
+    def analyze_sentence(self, text: str, language: Optional[str] = None, profile=None) -> Dict[str, Any]:
+        return self.detector.analyze_sentence(text, language=language, profile=self.profile)
+
+
+def share_models(candidate, detector):
+    candidate.models = detector.models
+    candidate.model_names = dict(detector.model_names)
+    return candidate
+
+
+def build_candidate(spec: str, detector, profiles):
+    kind, _, value = spec.partition(":")
+    if kind == "fast":
+        from ai_detector import AIDetector
+        candidate = AIDetector(fast_model_path=value, language_packs=detector.language_packs, models=ModelRegistry())
+        return share_models(candidate, detector)
+    if kind == "snapshot":
+        from ai_detector import AIDetector
+        candidate = AIDetector(snapshot_path=value, language_packs=detector.language_packs, models=ModelRegistry(), fast_model_path="")
+        return share_models(candidate, detector)
+    if kind == "profile":
+        return ProfileCandidate(detector, profiles.resolve(value))
+    return getattr(importlib.import_module(kind), value)(detector)
+
+
+class LatencyWindow:
+    def __init__(self, size: int = 1000):
+        self.samples = deque(maxlen=size)
+
+    def add(self, elapsed_ms: float):
+        self.samples.append(elapsed_ms)
+
+    def summary(self) -> Optional[Dict[str, float]]:
+        if not self.samples:
+            return None
+        values = np.array(self.samples)
+        return {
+            "mean_ms": round(float(values.mean()), 3),
+            "p50_ms": round(float(np.percentile(values, 50)), 3),
+            "p95_ms": round(float(np.percentile(values, 95)), 3)
+        }
+
+
+class ShadowEvaluator:
+    def __init__(
+        self,
+        candidate=None,
+        name: Optional[str] = None,
+        sample_rate: Optional[float] = None,
+        max_pending: Optional[int] = None,
+        workers: Optional[int] = None
+    ):
+        self.candidate = candidate
+        self.name = name
+        self.sample_rate = sample_rate if sample_rate is not None else float(os.getenv("SHADOW_SAMPLE_RATE", 0.01))
+        self.max_pending = max_pending if max_pending is not None else int(os.getenv("SHADOW_MAX_PENDING", 100))
+        self.workers = workers if workers is not None else int(os.getenv("SHADOW_WORKERS", 1))
+        self.compared = 0
+        self.agreed = 0
+        self.severity_agreed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.final_delta_sum = 0.0
+        self.final_abs_delta_sum = 0.0
+        self.final_max_abs_delta = 0.0
+        self.component_abs_delta_sums = {component: 0.0 for component in COMPONENTS}
+        self.primary_latency = LatencyWindow()
+        self.candidate_latency = LatencyWindow()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, self.workers), thread_name_prefix="shadow") if candidate is not None else None
+
+    @classmethod
+    def from_env(cls, detector, profiles) -> "ShadowEvaluator":
+        spec = os.getenv("SHADOW_CANDIDATE")
+        if not spec:
+            return cls()
+        try:
+            candidate = build_candidate(spec, detector, profiles)
+        except Exception as e:
+            print(f"Error building shadow candidate {spec}: {e}")
+            return cls()
+        print(f"Shadow evaluation enabled for {spec}")
+        return cls(candidate, spec)
+
+    @property
+    def enabled(self) -> bool:
+        return self.candidate is not None and self.sample_rate > 0
+
+    def observe(
+        self,
+        text: str,
+        primary: Dict[str, Any],
+        primary_ms: float,
+        language: Optional[str] = None,
+        profile=None
+    ) -> bool:
+        if not self.enabled or primary["degraded"] or random.random() >= self.sample_rate:
+            return False
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.dropped += 1
+                return False
+            self._pending += 1
+        self._executor.submit(self._compare, text, primary, primary_ms, language, profile)
+        return True
+
+    def _compare(self, text: str, primary: Dict[str, Any], primary_ms: float, language: Optional[str], profile):
+        try:
+            started = time.perf_counter()
+            candidate = self.candidate.analyze_sentence(text, language=language, profile=profile)
+            candidate_ms = (time.perf_counter() - started) * 1000.0
+
+            self._record(primary, candidate, primary_ms, candidate_ms)
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+            print(f"Shadow evaluation error: {e}")
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def _record(self, primary: Dict[str, Any], candidate: Dict[str, Any], primary_ms: float, candidate_ms: float):
+        delta = candidate["final_score"] - primary["final_score"]
+        with self._lock:
+            self.compared += 1
+            self.agreed += int(candidate["is_toxic"] == primary["is_toxic"])
+            self.severity_agreed += int(candidate["severity"] == primary["severity"])
+            self.final_delta_sum += delta
+            self.final_abs_delta_sum += abs(delta)
+            self.final_max_abs_delta = max(self.final_max_abs_delta, abs(delta))
+            for component in COMPONENTS:
+                key = component + "_score"
+                self.component_abs_delta_sums[component] += abs(candidate.get(key, 0.0) - primary.get(key, 0.0))
+            self.primary_latency.add(primary_ms)
+            self.candidate_latency.add(candidate_ms)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            compared = self.compared
+            return {
+                "candidate": self.name,
+                "sample_rate": self.sample_rate if self.candidate is not None else 0.0,
+                "compared": compared,
+                "pending": self._pending,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "agreement_rate": round(self.agreed / compared, 4) if compared else None,
+                "severity_agreement_rate": round(self.severity_agreed / compared, 4) if compared else None,
+                "final_score_delta": {
+                    "mean": round(self.final_delta_sum / compared, 4),
+                    "mean_abs": round(self.final_abs_delta_sum / compared, 4),
+                    "max_abs": round(self.final_max_abs_delta, 4)
+                } if compared else None,
+                "component_mean_abs_delta": {
+                    component: round(total / compared, 4) for component, total in self.component_abs_delta_sums.items()
+                } if compared else None,
+                "primary_latency": self.primary_latency.summary(),
+                "candidate_latency": self.candidate_latency.summary()
+            }
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
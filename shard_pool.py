@@ -0,0 +1,161 @@
+import asyncio
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+def warm_worker():
+    import detection
+
+
+def detect_shard(texts: List[str], strict_mode: bool, language: str, profile, custom_words: Set[str]) -> List[Dict[str, Any]]:
+    import detection
+    if detection.CUSTOM_BAD_WORDS != custom_words:
+        detection.CUSTOM_BAD_WORDS.clear()
+        detection.CUSTOM_BAD_WORDS.update(custom_words)
+    return detection.detect_profanity_many_stored(texts, strict_mode, language, profile)
+
+
+class ShardPool:
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        min_batch: Optional[int] = None,
+        min_shard_chars: Optional[int] = None,
+        max_shard_chars: Optional[int] = None,
+        retries: Optional[int] = None,
+        shard_fn: Callable[..., List[Any]] = detect_shard,
+        initializer: Optional[Callable[[], None]] = warm_worker
+    ):
+        self.workers = workers if workers is not None else int(os.getenv("SHARD_WORKERS", 0))
+        self.min_batch = min_batch if min_batch is not None else int(os.getenv("SHARD_MIN_BATCH", 256))
+        self.min_shard_chars = min_shard_chars if min_shard_chars is not None else int(os.getenv("SHARD_MIN_CHARS", 4000))
+        self.max_shard_chars = max_shard_chars if max_shard_chars is not None else int(os.getenv("SHARD_MAX_CHARS", 50000))
+        self.retries = retries if retries is not None else int(os.getenv("SHARD_RETRIES", 1))
+        self.shard_fn = shard_fn
+        self.initializer = initializer
+        self.batches = 0
+        self.shards = 0
+        self.retried_shards = 0
+        self.failed_shards = 0
+        self.restarts = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 1
+
+    def start(self):
+        if self.enabled:
+            self._ensure_pool()
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=self.initializer
+            )
+        return self._pool
+
+    def _restart(self, pool: ProcessPoolExecutor):
+        if self._pool is pool:
+            self._pool = None
+            self.restarts += 1
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def should_shard(self, texts: List[str]) -> bool:
+        return self.enabled and len(texts) >= self.min_batch
+
+    def plan(self, texts: List[str]) -> List[Tuple[int, int]]:
+        total_chars = sum(len(text) for text in texts)
+        shard_chars = math.ceil(total_chars / (self.workers * 4)) if self.workers else total_chars
+        shard_chars = max(self.min_shard_chars, min(self.max_shard_chars, shard_chars))
+
+        shards = []
+        start = 0
+        chars = 0
+        for index, text in enumerate(texts):
+            chars += len(text) + 1
+            if chars >= shard_chars:
+                shards.append((start, index + 1))
+                start = index + 1
+                chars = 0
+        if start < len(texts):
+            shards.append((start, len(texts)))
+        return shards
+
+    async def run(
+        self,
+        texts: List[str],
+        strict_mode: bool,
+        language: str,
+        profile,
+        custom_words: Set[str]
+    ) -> List[Any]:
+        loop = asyncio.get_running_loop()
+        shards = self.plan(texts)
+        results: List[Any] = [None] * len(texts)
+        pending = list(range(len(shards)))
+        self.batches += 1
+        self.shards += len(shards)
+
+        attempt = 0
+        while pending:
+            pending = await self._run_round(loop, texts, shards, pending, results, strict_mode, language, profile, custom_words)
+            if not pending:
+                break
+            if attempt >= self.retries:
+                self.retried_shards += len(pending)
+                for i in pending:
+                    if await self._run_round(loop, texts, shards, [i], results, strict_mode, language, profile, custom_words):
+                        self.failed_shards += 1
+                        start, end = shards[i]
+                        error = RuntimeError(f"Worker process crashed on texts {start}-{end - 1}")
+                        results[start:end] = [error] * (end - start)
+                break
+            self.retried_shards += len(pending)
+            attempt += 1
+        return results
+
+    async def _run_round(self, loop, texts, shards, pending, results, strict_mode, language, profile, custom_words) -> List[int]:
+        pool = self._ensure_pool()
+        futures = [
+            loop.run_in_executor(
+                pool, self.shard_fn, texts[shards[i][0]:shards[i][1]], strict_mode, language, profile, custom_words
+            )
+            for i in pending
+        ]
+        outcomes = await asyncio.gather(*futures, return_exceptions=True)
+
+        failed = []
+        for i, outcome in zip(pending, outcomes):
+            start, end = shards[i]
+            if isinstance(outcome, BrokenProcessPool):
+                failed.append(i)
+            elif isinstance(outcome, BaseException):
+                results[start:end] = [outcome] * (end - start)
+            else:
+                results[start:end] = outcome
+        if failed:
+            self._restart(pool)
+        return failed
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers if self.enabled else 0,
+            "running": self._pool is not None,
+            "batches": self.batches,
+            "shards": self.shards,
+            "retried_shards": self.retried_shards,
+            "failed_shards": self.failed_shards,
+            "restarts": self.restarts
+        }
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+import sklearn
+from scipy import sparse
+
+SNAPSHOT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+MATCHERS_FILE = "matchers.pkl"
+VECTORIZER_FILE = "vectorizer.pkl"
+MATRIX_FILES = {
+    "data": "reference_data.npy",
+    "indices": "reference_indices.npy",
+    "indptr": "reference_indptr.npy"
+}
+
+
+def lexicon_state(detector) -> Dict[str, Any]:
+    return {
+        "toxic_patterns": detector.toxic_patterns,
+        "toxic_words": {category: sorted(words) for category, words in detector.toxic_words.items()},
+        "context_indicators": detector.context_indicators,
+        "context_weights": detector.context_weights,
+        "sentiment_words": {category: sorted(words) for category, words in detector.sentiment_words.items()},
+        "safe_contexts": detector.safe_contexts,
+        "safe_context_words": detector.safe_context_words,
+        "toxic_phrases": detector.toxic_phrases,
+        "bypass_patterns": detector.bypass_patterns
+    }
+
+
+def content_hash(detector) -> str:
+    payload = json.dumps({
+        "snapshot_version": SNAPSHOT_VERSION,
+        "sklearn_version": sklearn.__version__,
+        "lexicon": lexicon_state(detector),
+        "models": detector.model_names
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def resolve_model_paths(model_names: Dict[str, str]) -> Dict[str, str]:
+    resolved = {}
+    for name, model_id in model_names.items():
+        resolved[name] = model_id
+        try:
+            from huggingface_hub import snapshot_download
+            resolved[name] = snapshot_download(model_id, local_files_only=True)
+        except Exception as e:
+            print(f"Model {model_id} not found in local cache, keeping hub id: {e}")
+    return resolved
+
+
+def build_snapshot(detector, path: str) -> Dict[str, Any]:
+    os.makedirs(path, exist_ok=True)
+
+    with open(os.path.join(path, MATCHERS_FILE), "wb") as f:
+        pickle.dump({
+            "compiled_patterns": detector.compiled_patterns,
+            "compiled_bypass_patterns": detector.compiled_bypass_patterns,
+            "word_matchers": detector.word_matchers
+        }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    with open(os.path.join(path, VECTORIZER_FILE), "wb") as f:
+        pickle.dump(detector.vectorizer, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    matrix = sparse.csr_matrix(detector._toxic_vectors)
+    for key, filename in MATRIX_FILES.items():
+        np.save(os.path.join(path, filename), getattr(matrix, key))
+
+    files = [MATCHERS_FILE, VECTORIZER_FILE] + list(MATRIX_FILES.values())
+    manifest = {
+        "snapshot_version": SNAPSHOT_VERSION,
+        "content_hash": content_hash(detector),
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "matrix_shape": list(matrix.shape),
+        "model_paths": resolve_model_paths(detector.model_names),
+        "files": {filename: file_hash(os.path.join(path, filename)) for filename in files}
+    }
+    with open(os.path.join(path, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def load_snapshot(detector, path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(path, MANIFEST_FILE), "r") as f:
+            manifest = json.load(f)
+
+        if manifest.get("snapshot_version") != SNAPSHOT_VERSION:
+            print(f"Ignoring snapshot {path}: version {manifest.get('snapshot_version')} != {SNAPSHOT_VERSION}")
+            return None
+        if manifest.get("content_hash") != content_hash(detector):
+            print(f"Ignoring snapshot {path}: lexicon or library versions changed since it was built")
+            return None
+        for filename, expected in manifest["files"].items():
+            if file_hash(os.path.join(path, filename)) != expected:
+                print(f"Ignoring snapshot {path}: {filename} does not match its recorded hash")
+                return None
+
+        with open(os.path.join(path, MATCHERS_FILE), "rb") as f:
+            matchers = pickle.load(f)
+        with open(os.path.join(path, VECTORIZER_FILE), "rb") as f:
+            vectorizer = pickle.load(f)
+        arrays = {key: np.load(os.path.join(path, filename), mmap_mode="r") for key, filename in MATRIX_FILES.items()}
+        matrix = sparse.csr_matrix(
+            (arrays["data"], arrays["indices"], arrays["indptr"]),
+            shape=tuple(manifest["matrix_shape"]),
+            copy=False
+        )
+    except Exception as e:
+        print(f"Error loading snapshot {path}: {e}")
+        return None
+
+    detector.compiled_patterns = matchers["compiled_patterns"]
+    detector.compiled_bypass_patterns = matchers["compiled_bypass_patterns"]
+    detector.word_matchers = matchers["word_matchers"]
+    detector.vectorizer = vectorizer
+    detector._toxic_vectors = matrix
+    for name, model_path in manifest.get("model_paths", {}).items():
+        if os.path.isdir(model_path):
+            detector.model_names[name] = model_path
+    return manifest
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else "build"
+    path = sys.argv[2] if len(sys.argv) > 2 else os.getenv("DETECTOR_SNAPSHOT", "detector_snapshot")
+
+    from ai_detector import AIDetector
+
+    if command == "build":
+        print(f"🔄 Building detector snapshot in {path}...")
+        manifest = build_snapshot(AIDetector(), path)
+        print(f"✅ Snapshot written (content hash {manifest['content_hash'][:12]})")
+        return 0
+    if command == "verify":
+        started = time.perf_counter()
+        detector = AIDetector(snapshot_path=path)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        if detector.snapshot_info is None:
+            print(f"❌ Snapshot {path} is missing or stale; rebuild it with: python snapshot.py build {path}")
+            return 1
+        print(f"✅ Snapshot {path} is valid, detector ready in {elapsed_ms:.1f} ms")
+        return 0
+
+    print("Usage: python snapshot.py [build|verify] [path]")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -113,6 +113,18 @@ def test_health_check():
         print(f"Profanity filter loaded: {result['profanity_filter_loaded']}")
         print()
 
+def test_metrics():
+    print("=== Testing Metrics ===")
+    
+    response = requests.get(f"{BASE_URL}/metrics")
+    
+    if response.status_code == 200:
+        result = response.json()
+        for lane, stats in result['admission'].items():
+            print(f"Lane {lane}: active={stats['active']} queued={stats['queued']} rejected={stats['rejected']}")
+        print(f"Stage cost estimates: {result['stage_cost_estimates_ms']}")
+        print()
+
 def test_api_info():
     print("=== Testing API Information ===")
     
@@ -134,6 +146,7 @@ if __name__ == "__main__":
         test_single_detection()
         test_batch_detection()
         test_custom_words()
+        test_metrics()
         
         print("All tests completed successfully!")
         
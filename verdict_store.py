@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    key TEXT PRIMARY KEY,
+    result TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS verdicts_last_used ON verdicts (last_used);
+"""
+
+
+def verdict_key(text: str, version: str, options: Dict[str, Any]) -> str:
+    digest = hashlib.sha256()
+    digest.update(version.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(json.dumps(options, sort_keys=True).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class VerdictStore:
+    def __init__(
+        self,
+        path: str,
+        max_bytes: Optional[int] = None,
+        touch_seconds: float = 60.0,
+        check_every: int = 256
+    ):
+        self.path = path
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("VERDICT_STORE_MAX_MB", 256)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.touch_seconds = touch_seconds
+        self.check_every = check_every
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+        self._writes_since_check = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        connection.executescript(SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        found = {}
+        if not keys:
+            return found
+        try:
+            connection = self._connection()
+            stale = []
+            now = time.time()
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = connection.execute(
+                    f"SELECT key, result, last_used FROM verdicts WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for key, result, last_used in rows:
+                    found[key] = json.loads(result)
+                    if now - last_used > self.touch_seconds:
+                        stale.append((now, key))
+            if stale:
+                self._write(connection, "UPDATE verdicts SET last_used = ? WHERE key = ?", stale)
+        except sqlite3.Error as e:
+            self._error("reading", e)
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(set(keys)) - len(found)
+        return found
+
+    def put(self, key: str, result: Dict[str, Any]):
+        self.put_many({key: result})
+
+    def put_many(self, results: Dict[str, Dict[str, Any]]):
+        if not results:
+            return
+        now = time.time()
+        rows = []
+        for key, result in results.items():
+            payload = json.dumps(result)
+            rows.append((key, payload, len(payload) + len(key), now))
+        try:
+            self._write(
+                self._connection(),
+                "INSERT OR REPLACE INTO verdicts (key, result, size, last_used) VALUES (?, ?, ?, ?)",
+                rows
+            )
+        except sqlite3.Error as e:
+            self._error("writing", e)
+            return
+        with self._lock:
+            self.writes += len(rows)
+            self._writes_since_check += len(rows)
+            check = self._writes_since_check >= self.check_every
+            if check:
+                self._writes_since_check = 0
+        if check:
+            self.evict()
+
+    def _write(self, connection: sqlite3.Connection, statement: str, rows: List[tuple]):
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(statement, rows)
+        except sqlite3.Error:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def total_bytes(self) -> int:
+        return int(self._connection().execute("SELECT COALESCE(SUM(size), 0) FROM verdicts").fetchone()[0])
+
+    def evict(self):
+        try:
+            total = self.total_bytes()
+            if total <= self.max_bytes:
+                return
+            connection = self._connection()
+            target = int(self.max_bytes * 0.9)
+            removed = 0
+            while total > target:
+                rows = connection.execute("SELECT key, size FROM verdicts ORDER BY last_used LIMIT 1000").fetchall()
+                if not rows:
+                    break
+                doomed = []
+                for key, size in rows:
+                    if total <= target:
+                        break
+                    total -= size
+                    doomed.append((key,))
+                self._write(connection, "DELETE FROM verdicts WHERE key = ?", doomed)
+                removed += len(doomed)
+            with self._lock:
+                self.evictions += removed
+        except sqlite3.Error as e:
+            self._error("evicting from", e)
+
+    def _error(self, action: str, error: Exception):
+        with self._lock:
+            self.errors += 1
+        print(f"Error {action} verdict store {self.path}: {error}")
+
+    def stats(self) -> Dict[str, Any]:
+        try:
+            entries, total = self._connection().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM verdicts").fetchone()
+        except sqlite3.Error:
+            entries, total = None, None
+        return {
+            "path": self.path,
+            "entries": entries,
+            "total_bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors
+        }